@@ -1,16 +1,69 @@
 from datetime import datetime as dt, timedelta as tΔ
+from typing import Dict, Iterable, Optional, Tuple
 from .registry import register_type
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed by the batch conversions
+    np = None
+
+TICKS_PER_SECOND = 10_000_000  # .NET ticks are 100 ns since 0001-01-01
+TICKS_PER_DAY = 86_400 * TICKS_PER_SECOND
+EPOCH_TICKS = 621_355_968_000_000_000  # .NET ticks at 1970-01-01
+
+# "yyyy-MM-dd HH:mm:ss" or "yyyy:MM:dd HH:mm:ss" -> (ticks, datetime fields) of
+# that second. Consecutive samples share their prefix, so most lookups hit.
+_seconds: Dict[str, Tuple[int, tuple]] = {}
+_CACHE_SIZE = 4096
+
+
+def _split(text: str) -> Optional[Tuple[int, tuple, int]]:
+    """Parse a TickTime string laid out at fixed offsets.
+
+    Returns the ticks and datetime fields of the whole second and the
+    microseconds, or None if `text` is not in the fixed layout.
+    """
+    fraction = text[20:]
+    if not (0 < len(fraction) <= 6 and fraction.isdigit() and fraction.isascii()):
+        return None
+    if text[19] != " ":  # The fraction check above ensures len(text) > 20
+        return None
+    prefix = text[:19]
+    second = _seconds.get(prefix)
+    if second is None:
+        separator = prefix[4]
+        digits = prefix[:4] + prefix[5:7] + prefix[8:10] + prefix[11:13] + prefix[14:16] + prefix[17:]
+        if (separator not in "-:" or prefix[7] != separator or prefix[10] != " "
+                or prefix[13] != ":" or prefix[16] != ":"
+                or not (digits.isdigit() and digits.isascii())):
+            return None
+        try:
+            t = dt(int(prefix[:4]), int(prefix[5:7]), int(prefix[8:10]),
+                   int(prefix[11:13]), int(prefix[14:16]), int(prefix[17:]))
+        except ValueError:
+            return None
+        ticks = ((t.toordinal() - 1) * TICKS_PER_DAY
+                 + (t.hour * 3600 + t.minute * 60 + t.second) * TICKS_PER_SECOND)
+        second = ticks, (t.year, t.month, t.day, t.hour, t.minute, t.second)
+        if len(_seconds) >= _CACHE_SIZE:
+            _seconds.clear()
+        _seconds[prefix] = second
+    # Like %f, the fraction is the leading digits of the microseconds.
+    return second[0], second[1], int(fraction) * 10 ** (6 - len(fraction))
+
 
 @register_type("TAU.Module.Channels.DI.TimeTick")
 class TimeTick(dt):
     def __new__(cls, TickTime):
-        if "-" in TickTime:
+        if isinstance(TickTime, int) or TickTime.isdigit():
+            t = dt(1, 1, 1) + tΔ(microseconds=int(TickTime) // 10)
+        elif parsed := _split(TickTime):
+            _, fields, microsecond = parsed
+            return dt.__new__(cls, *fields, microsecond)
+        elif "-" in TickTime:
             t = dt.strptime(TickTime, "%Y-%m-%d %H:%M:%S %f")
-        elif ":" in TickTime:
-            t = dt.strptime(TickTime, "%Y:%m:%d %H:%M:%S %f")
         else:
-            t = dt(1, 1, 1) + tΔ(seconds=int(TickTime) / 1e7)
+            t = dt.strptime(TickTime, "%Y:%m:%d %H:%M:%S %f")
         return dt.__new__(
             cls,
             t.year,
@@ -24,10 +77,51 @@ class TimeTick(dt):
 
     def to_ticks(self) -> int:
         "long timestamp format (ticks since 1/1/0001)"
-        return round((self - dt(1, 1, 1)).total_seconds() * 1000) * 10000
+        seconds = (self.hour * 60 + self.minute) * 60 + self.second
+        return ((self.toordinal() - 1) * TICKS_PER_DAY + seconds * TICKS_PER_SECOND
+                + self.microsecond * 10)
 
     def to_short_format(self) -> str:
         return self.strftime("%Y:%m:%d %H:%M:%S %f")[:-3]
 
     def __str__(self):
-        return self.to_ticks()
+        return str(self.to_ticks())
+
+
+def parse_ticks(TickTime: str) -> int:
+    """Return the .NET ticks of a TickTime string without building a TimeTick."""
+    if TickTime.isdigit():
+        return int(TickTime)
+    if parsed := _split(TickTime):
+        ticks, _, microsecond = parsed
+        return ticks + microsecond * 10
+    return TimeTick(TickTime).to_ticks()
+
+
+def to_epoch_ns(stamps: Iterable):
+    """Convert TickTime strings or .NET ticks to nanoseconds since 1970.
+
+    Args:
+        stamps: TickTime strings in any format TimeTick accepts, .NET ticks,
+            or an integer NumPy array of .NET ticks (converted without a loop).
+
+    Returns:
+        numpy.ndarray: ``int64`` nanoseconds since the Unix epoch.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("to_epoch_ns requires NumPy (pip install numpy).")
+    if isinstance(stamps, np.ndarray) and stamps.dtype.kind in "iu":
+        ticks = stamps.astype(np.int64, copy=False)
+    else:
+        ticks = np.fromiter(
+            (parse_ticks(s) if isinstance(s, str) else s for s in stamps), dtype=np.int64
+        )
+    return (ticks - EPOCH_TICKS) * 100
+
+
+def to_datetime64(stamps: Iterable):
+    """Like :func:`to_epoch_ns`, but return a ``datetime64[ns]`` array."""
+    return to_epoch_ns(stamps).view("datetime64[ns]")
@@ -1,8 +1,17 @@
 # __init__.py - Base class for Additel SDK.
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from json import loads
 from traceback import print_tb
-from time import time, sleep
+from time import perf_counter, time, sleep
+from typing import Iterator, List, NoReturn, Optional
 
+from .aio import AsyncAdditel  # noqa: F401
+from .batch import CommandBatch
+from .coerce import coerce as _coerce  # Keeps `additel_sdk.coerce` the module
+from .discovery import discover, DiscoveredDevice  # noqa: F401
 from .module import Module
 from .scan import Scan
 from .channel import Channel
@@ -14,36 +23,32 @@ from .system import System
 # from .pattern import Pattern
 from .unit import Unit
 from .errors import AdditelError
+from .journal import CommandJournal, CommandRecord  # noqa: F401
+from .metrics import Metrics
+from .scpi import header, is_query
+from .timeouts import TimeoutPolicy  # noqa: F401
+from .tracing import span
+from .log import ConnectionTypeFilter, Truncated, configure_logging  # noqa: F401
 
-
-class ConnectionTypeFilter(logging.Filter):
-    def __init__(self, conn_type):
-        super().__init__()
-        self.conn_type = conn_type
-
-    def filter(self, record):
-        record.connection_type = self.conn_type
-        return True
-
-
-logging.basicConfig(
-    filename="additel.log",
-    level=logging.DEBUG,
-    format='%(asctime)s [%(levelname)s] (%(connection_type)s) %(message)s',
-    force=True
-)
+logger = logging.getLogger(__name__)
 
 
 class Additel:
     """Base class for interacting with an Additel device using different connection
     types.
+
+    One handle may be shared between threads. Each command/response transaction
+    (`cmd`, `cmd_many`, a `batch` block) runs under a per-connection lock, so
+    responses are never crossed; `submit` queues commands on a single dispatcher
+    thread and returns futures.
+
+    Round-trip latency, bytes and parse time are recorded per command header in
+    `metrics` (see :class:`Metrics`).
     """
 
-    def __init__(self, connection_type="wlan", **kwargs):
+    def __init__(self, connection_type="wlan", journal_capacity=1000, **kwargs):
         self.type = connection_type
-        _logger = logging.getLogger()
-        if not any(isinstance(f, ConnectionTypeFilter) for f in _logger.filters):
-            _logger.addFilter(ConnectionTypeFilter(self.type))
+        self._log_extra = {"connection_type": connection_type}
         self.connection = Connection(self, connection_type=self.type, **kwargs)
 
         # Initialize the submodules
@@ -58,11 +63,20 @@ class Additel:
         # self.Pattern = Pattern(self)
         self.Unit = Unit(self)
 
-        self.command_log = []
-        logging.debug(f"Additel initialized with connection type: {connection_type}")
+        self.journal = CommandJournal(journal_capacity)
+        self.metrics = Metrics()
+        self._last_header = None  # Header of the query whose response was read last
+        self._batch = None
+        self._lock = threading.RLock()
+        self._dispatcher = None
+        logger.debug(
+            "Additel initialized with connection type: %s", connection_type,
+            extra=self._log_extra,
+        )
 
     def __enter__(self):
-        self.connection.__enter__()
+        with span("additel.connect", connection_type=self.type):
+            self.connection.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -70,29 +84,248 @@ class Additel:
             print(f"Exception type: {exc_type}")
             print(f"Exception value: {exc_value}")
             print_tb(traceback)
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown(wait=True)
+            self._dispatcher = None
         self.connection.__exit__(exc_type, exc_value, traceback)
 
-    def send_command(self, command: str) -> None:
-        """Send a command to the connected device and return the response."""
-        self.connection.send_command(command.strip())
-        self.command_log.append(command)
-        logging.info(f"Command: {command}")
+    def send_command(self, command: str) -> CommandRecord:
+        """Send a command to the connected device and return its journal record."""
+        with self._lock:
+            if self._batch is not None:
+                if not is_query(command):
+                    self._batch.add(command)
+                    record = self.journal.sent(command, queued=True)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Queued command: %s", Truncated(command),
+                                    extra=self._log_extra)
+                    return record
+                self._flush_batch()
+            with span("additel.send", command=command, payload_size=len(command)):
+                self.connection.send_command(command.strip())
+            record = self._sent(command)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Command: %s", Truncated(command), extra=self._log_extra)
+            return record
+
+    def _sent(self, command: str) -> CommandRecord:
+        record = self.journal.sent(command)
+        if record.outcome == "sent":
+            self.metrics.observe(header(command), bytes_sent=record.bytes_sent)
+        return record
+
+    @contextmanager
+    def batch(self, max_length: int = 256):
+        """Queue non-query commands and send them as SCPI compound messages.
+
+        Within the block, commands sent with `send_command` (including all the
+        setters) are queued instead of written. On exit they are joined into
+        compound messages of at most `max_length` characters, written together,
+        and the error queue is checked once with SYSTem:ERRor?. A query inside
+        the block first flushes the commands queued before it. Other threads
+        wait for the block to finish before sending their own commands.
+
+        Args:
+            max_length (int): Maximum length of one compound message.
 
-    def read_response(self) -> str:
+        Raises:
+            AdditelError: If the device reports an error after the flush.
+        """
+        with self._lock:
+            if self._batch is not None:  # Nested batches join the outer one
+                yield self._batch
+                return
+            self._batch = CommandBatch(max_length)
+            try:
+                yield self._batch
+                self._flush_batch()
+            finally:
+                self._batch = None
+            error = self.System.get_error()
+            if error["error_code"] != 0:
+                raise AdditelError(**error)
+
+    def _flush_batch(self) -> None:
+        if not self._batch:
+            return
+        messages = self._batch.messages()
+        self._batch.clear()
+        self.connection.send_many(messages)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Sent %d compound message(s): %s", len(messages),
+                        Truncated(messages), extra=self._log_extra)
+
+    @property
+    def command_log(self) -> List[str]:
+        """The most recent commands sent, oldest first (see `journal`)."""
+        return self.journal.commands()
+
+    def read_response(self, record: Optional[CommandRecord] = None) -> str:
+        """Read one response; `record` is the journal record of its query."""
         try:
-            response = self.connection.read_response()
-            logging.info(f"Response: {response}")
+            with span("additel.receive") as trace:
+                response = self.connection.read_response()
+                record = self.journal.received(response, record=record)
+                if record is not None:
+                    trace.set_attribute("command", record.command)
+                    trace.set_attribute("payload_size", record.bytes_received)
+            self._observe(record)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Response: %s", Truncated(response), extra=self._log_extra)
             return response
         except TimeoutError as e:
+            self._observe(self.journal.received(None, outcome="timeout", record=record))
+            self._raise_device_error(e)
+        except Exception:
+            self._observe(self.journal.received(None, outcome="error", record=record))
+            raise
+
+    def _raise_device_error(self, timeout: TimeoutError) -> NoReturn:
+        """Raise the error the device reports for a response that timed out."""
+        try:
+            raise AdditelError(**self.System.get_error()) from timeout
+        except Exception as nested:
+            msg = "Failed to retrieve error details after timeout."
+            raise RuntimeError(msg) from nested
+
+    def _observe(self, record: Optional[CommandRecord]) -> None:
+        if record is None:
+            return
+        self._last_header = header(record.command)
+        if record.outcome in ("ok", "empty"):
+            self.metrics.observe(
+                self._last_header,
+                latency=record.latency,
+                bytes_sent=record.bytes_sent,
+                bytes_received=record.bytes_received,
+            )
+        else:
+            self.metrics.count_error(self._last_header, record.outcome)
+
+    def parse(self, parser, response: str):
+        """Return `parser(response)`, recording the parse time in `metrics`.
+
+        The time is attributed to the header of the query whose response was
+        read last.
+        """
+        start = perf_counter()
+        with span("additel.parse", command=self._last_header,
+                  parser=getattr(parser, "__qualname__", None),
+                  payload_size=len(response)) as trace:
+            result = parser(response)
+            if isinstance(result, list):
+                trace.set_attribute("channel_count", len(result))
+        if self._last_header is not None:
+            self.metrics.observe(self._last_header, parse=perf_counter() - start)
+        return result
+
+    def stream_json(self, command: str) -> Iterator:
+        """Send a JSON list query and yield each element as soon as it is decoded.
+
+        Unlike ``coerce(self.cmd(command))``, the whole response is never held
+        in memory: each element of ``$values`` is decoded as soon as its bytes
+        have arrived.
+
+        The handle stays locked until the generator is exhausted or closed, so a
+        caller that stops early must close it (e.g. with ``contextlib.closing``);
+        an abandoned generator keeps the lock until it is garbage collected. A
+        generator closed early reads and discards the rest of the response.
+
+        Raises:
+            RuntimeError: If the response times out, chained to the
+                :class:`AdditelError` the device reports, as in `read_response`.
+        """
+        with self._lock:
+            sent = self.send_command(command)
+            received = parse_time = 0
             try:
-                raise AdditelError(**self.System.get_error()) from e
-            except Exception as nested:
-                msg = "Failed to retrieve error details after timeout."
-                raise RuntimeError(msg) from nested
+                with span("additel.receive", command=command) as trace:
+                    for element in self.connection.read_json_values():
+                        received += len(element)
+                        start = perf_counter()
+                        value = _coerce(loads(element))
+                        parse_time += perf_counter() - start
+                        yield value
+                    trace.set_attribute("payload_size", received)
+            except GeneratorExit:
+                self._stream_received(sent, received, parse_time)
+                raise
+            except TimeoutError as e:
+                self._stream_received(sent, received, outcome="timeout")
+                self._raise_device_error(e)
+            except Exception:
+                self._stream_received(sent, received, outcome="error")
+                raise
+            self._stream_received(sent, received, parse_time)
+
+    def _stream_received(self, record: CommandRecord, received: int,
+                         parse_time: float = 0, outcome: str = "ok") -> None:
+        self.journal.received(None, outcome=outcome, record=record)
+        record.bytes_received = received
+        self._observe(record)
+        if outcome == "ok":
+            self.metrics.observe(self._last_header, parse=parse_time)
 
     def cmd(self, command) -> str:
-        self.send_command(command)
-        return self.read_response()
+        with self._lock:
+            return self.read_response(self.send_command(command))
+
+    def _exchange(self, command: str) -> Optional[str]:
+        """Send `command` and return its response, or None if it is not a query."""
+        with self._lock:
+            record = self.send_command(command)
+            return self.read_response(record) if is_query(command) else None
+
+    def submit(self, command: str) -> Future:
+        """Queue a command on the dispatcher thread shared by all callers.
+
+        Commands are sent in the order they are submitted, one transaction at a
+        time, so any number of threads can share the connection.
+
+        Args:
+            command (str): The command to send.
+
+        Returns:
+            Future: Resolves to the response for a query, or None otherwise.
+        """
+        with self._lock:
+            dispatcher = self._dispatcher
+            if dispatcher is None:
+                dispatcher = self._dispatcher = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="AdditelDispatcher"
+                )
+            return dispatcher.submit(self._exchange, command)
+
+    def cmd_many(self, commands: List[str]) -> List[Optional[str]]:
+        """Send several commands, then read their responses in order.
+
+        On connections that support pipelining, every command is written before
+        any response is read, so a batch of queries costs a single round trip.
+        Other connections fall back to one `cmd` per query.
+
+        Args:
+            commands (List[str]): The commands to send, in order.
+
+        Returns:
+            List[Optional[str]]: One entry per command; None for commands that are
+            not queries and so produce no response.
+        """
+        commands = [command.strip() for command in commands]
+        with self._lock:
+            if not self.connection.pipelining:
+                return [self._exchange(command) for command in commands]
+            if self._batch is not None:
+                self._flush_batch()  # Commands queued before these go first
+            payload = "\n".join(commands)
+            with span("additel.send", command=payload, payload_size=len(payload)):
+                self.connection.send_many(commands)
+            records = [self._sent(command) for command in commands]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Commands: %s", Truncated(commands), extra=self._log_extra)
+            return [
+                self.read_response(record) if is_query(command) else None
+                for command, record in zip(commands, records)
+            ]
 
     # Section 1 - Commands Instruction
 
@@ -151,7 +384,7 @@ class Additel:
         while time() - start_time < timeout:
             response = self.opc()
             if response == '1':
-                logging.info("Operation complete.")
+                logger.info("Operation complete.", extra=self._log_extra)
                 return True
             sleep(1)  # Wait for 1 second before retrying
         raise TimeoutError("Operation did not complete within the timeout period.")
@@ -169,14 +402,14 @@ class Additel:
         """Query and interpret the Standard Event Status Enable Register (*ESE?)."""
         raw = int(self.cmd("*ESE?"))
         parsed = self.parse_status_register(raw)
-        logging.info(f"*ESE? = {raw:08b} => {parsed}")
+        logger.info("*ESE? = %s => %s", format(raw, "08b"), parsed, extra=self._log_extra)
         return parsed
 
     def get_event_status_register(self) -> dict:
         """Query and interpret the Standard Event Status Register (*ESR?)."""
         raw = int(self.cmd("*ESR?"))
         parsed = self.parse_status_register(raw)
-        logging.info(f"*ESR? = {raw:08b} => {parsed}")
+        logger.info("*ESR? = %s => %s", format(raw, "08b"), parsed, extra=self._log_extra)
         return parsed
 
     # Table 4-3 Standard Event Register Bit Definition
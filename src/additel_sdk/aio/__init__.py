@@ -0,0 +1,136 @@
+# aio/__init__.py - asyncio client for Additel devices.
+import asyncio
+import logging
+from typing import List, Optional
+
+from ..errors import AdditelError
+from ..journal import CommandJournal, CommandRecord
+from ..log import Truncated
+from ..scpi import is_query
+from .channel import AsyncChannel
+from .connection import (
+    AsyncTCPConnection,
+    AsyncWLANConnection,
+    AsyncEthernetConnection,
+)
+from .module import AsyncModule
+from .scan import AsyncScan
+from .system import AsyncSystem
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "AsyncAdditel",
+    "AsyncTCPConnection",
+    "AsyncWLANConnection",
+    "AsyncEthernetConnection",
+]
+
+
+class AsyncAdditel:
+    """asyncio counterpart of :class:`~additel_sdk.Additel`.
+
+    Example:
+        >>> async with AsyncAdditel("wlan", ip="192.168.1.223") as device:
+        ...     readings = await device.Scan.get_data_json(10)
+
+    Commands on one device are serialized by a lock, so several tasks can share a
+    handle; separate devices proceed concurrently on the same event loop.
+    """
+
+    def __init__(self, connection_type="wlan", journal_capacity=1000, **kwargs):
+        self.type = connection_type
+        self._log_extra = {"connection_type": connection_type}
+        self.connection = AsyncTCPConnection.create(connection_type, **kwargs)
+        self._lock = asyncio.Lock()
+
+        self.Module = AsyncModule(self)
+        self.Scan = AsyncScan(self)
+        self.Channel = AsyncChannel(self)
+        self.System = AsyncSystem(self)
+
+        self.journal = CommandJournal(journal_capacity)
+        logger.debug(
+            "AsyncAdditel initialized with connection type: %s", self.type,
+            extra=self._log_extra,
+        )
+
+    async def __aenter__(self):
+        await self.connection.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.connection.__aexit__(exc_type, exc_value, traceback)
+
+    async def send_command(self, command: str) -> None:
+        """Send a command that produces no response."""
+        async with self._lock:
+            await self._send(command)
+
+    async def _send(self, command: str) -> CommandRecord:
+        await self.connection.send_command(command.strip())
+        record = self.journal.sent(command)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Command: %s", Truncated(command), extra=self._log_extra)
+        return record
+
+    @property
+    def command_log(self) -> List[str]:
+        """The most recent commands sent, oldest first (see `journal`)."""
+        return self.journal.commands()
+
+    async def _read(self, record: Optional[CommandRecord] = None) -> Optional[str]:
+        try:
+            response = await self.connection.read_response()
+            self.journal.received(response, record=record)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Response: %s", Truncated(response), extra=self._log_extra)
+            return response
+        except TimeoutError as e:
+            self.journal.received(None, outcome="timeout", record=record)
+            try:
+                query = await self._send("SYSTem:ERRor?")
+                response = await self.connection.read_response()
+                self.journal.received(response, record=query)
+                error = AsyncSystem.parse_error(response)
+            except Exception as nested:
+                msg = "Failed to retrieve error details after timeout."
+                raise RuntimeError(msg) from nested
+            raise AdditelError(**error) from e
+        except Exception:
+            self.journal.received(None, outcome="error", record=record)
+            raise
+
+    async def cmd(self, command: str) -> Optional[str]:
+        """Send a query and return its response."""
+        async with self._lock:
+            return await self._read(await self._send(command))
+
+    async def cmd_many(self, commands: List[str]) -> List[Optional[str]]:
+        """Send several commands in one write, then read their responses in order.
+
+        Returns:
+            List[Optional[str]]: One entry per command; None for non-queries.
+        """
+        commands = [command.strip() for command in commands]
+        async with self._lock:
+            await self.connection.send_many(commands)
+            records = [self.journal.sent(command) for command in commands]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Commands: %s", Truncated(commands), extra=self._log_extra)
+            return [
+                await self._read(record) if is_query(command) else None
+                for command, record in zip(commands, records)
+            ]
+
+    async def identify(self) -> dict:
+        """Query the device identification (*IDN?)."""
+        psn, svn = (await self.cmd("*IDN?")).split(",")
+        return {
+            "Product Sequence Number": psn[1:-1],
+            "Software Version Number": svn,
+        }
+
+    async def opc(self) -> str:
+        """Send an operation complete query (*OPC?) and return the response."""
+        return await self.cmd("*OPC?")
@@ -0,0 +1,29 @@
+# aio/channel.py - asyncio version of the Channel commands.
+from typing import TYPE_CHECKING, List
+
+from ..channel import Channel, DIFunctionChannelConfig
+from ..coerce import coerce
+
+if TYPE_CHECKING:
+    from . import AsyncAdditel
+
+
+class AsyncChannel:
+    """asyncio counterpart of :class:`~additel_sdk.channel.Channel`."""
+
+    def __init__(self, parent: "AsyncAdditel"):
+        self.parent = parent
+
+    async def get_configuration_json(
+        self, channel_names: List[str]
+    ) -> List[DIFunctionChannelConfig]:
+        for name in channel_names:
+            Channel.validate_name(name)
+        names_str = ",".join(channel_names)
+        if response := await self.parent.cmd(f'CHANnel:CONFig:JSON? "{names_str}"'):
+            return coerce(response)
+
+    async def get_configuration(self, channel_name: str) -> DIFunctionChannelConfig:
+        Channel.validate_name(channel_name)
+        if response := await self.parent.cmd(f'CHANnel:CONFig? "{channel_name}"'):
+            return DIFunctionChannelConfig.from_str(response)
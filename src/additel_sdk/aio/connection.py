@@ -0,0 +1,142 @@
+# aio/connection.py - asyncio transports for Additel devices over TCP.
+import asyncio
+import codecs
+import logging
+import os
+from typing import List, Optional
+from ..connection.framing import ResponseFramer
+from ..log import Truncated
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTCPConnection:
+    """Base class for asyncio connections that exchange SCPI lines over TCP.
+
+    This mirrors :class:`~additel_sdk.connection.tcp.TCPConnection`, but is built
+    on ``asyncio.open_connection`` so many devices can be driven from one event
+    loop without a thread per device.
+    """
+
+    registry = {}
+    default_port = None
+    default_timeout = 1
+    chunk_size = 16384
+    partial_timeout = 0.05  # Wait this long for the end of an unterminated reply
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "type"):
+            AsyncTCPConnection.registry[cls.type] = cls
+
+    @classmethod
+    def create(cls, connection_type: str, **kwargs) -> "AsyncTCPConnection":
+        subclass = cls.registry.get(connection_type)
+        if not subclass:
+            raise ValueError(f"Unsupported connection type: {connection_type}")
+        return subclass(**kwargs)
+
+    def __init__(self, **kwargs):
+        self.ip = kwargs.pop("ip", None)
+        self.port = kwargs.pop("port", self.default_port)
+        self.timeout = kwargs.pop("timeout", self.default_timeout)
+        self.encoding = kwargs.pop("encoding", "utf-8")
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self._framer = ResponseFramer()
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+
+    async def __aenter__(self):
+        """Establish a socket connection to the device."""
+        self._framer.clear()
+        self._decoder.reset()
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.ip, self.port), self.timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.error("Error connecting to Additel device: %s", e)
+            raise ConnectionError(
+                f"Failed to connect to {self.ip}:{self.port} - {e}"
+            ) from e
+        return self
+
+    async def __aexit__(self, exc_type=None, exc_value=None, traceback=None):
+        """Close the socket connection."""
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+            self.reader = self.writer = None
+
+    async def send_command(self, command: str) -> None:
+        """Send a command to the device."""
+        await self.send_many([command])
+
+    async def send_many(self, commands: List[str]) -> None:
+        """Write several commands back to back in a single send."""
+        if not self.writer:
+            raise ConnectionError(f"{type(self).__name__} is not established.")
+        data = "".join(f"{command}\n" for command in commands).encode(self.encoding)
+        try:
+            self.writer.write(data)
+            await self.writer.drain()
+        except OSError as e:
+            logger.error("Error sending commands %s: %s", Truncated(commands), e)
+            raise IOError(f"Failed to send commands {commands} - {e}") from e
+
+    async def read_response(self, chunk_size: Optional[int] = None) -> Optional[str]:
+        """Read the response from the connected device in chunks until complete."""
+        chunk_size = chunk_size or self.chunk_size
+        parts = []
+        while (frame := self._framer.pop()) is None:
+            timeout = self.timeout
+            if self._framer.pending_text:
+                # An unterminated text reply is accepted once the device goes quiet.
+                # A partial JSON reply is never accepted, so wait for the rest.
+                timeout = self.partial_timeout
+            try:
+                chunk = await asyncio.wait_for(self.reader.read(chunk_size), timeout)
+            except asyncio.TimeoutError:
+                if (partial := self._framer.pop_partial()) is None:
+                    raise TimeoutError("No complete response within the timeout.")
+                parts.append(self._decoder.decode(partial))
+                if not self._decoder.getstate()[0]:
+                    break
+                continue
+            if not chunk:
+                break
+            self._framer.feed(chunk)
+        if frame is not None:
+            parts.append(self._decoder.decode(frame))
+        elif not parts:
+            return None
+        parts.append(self._decoder.decode(b"", final=True))
+        return "".join(parts)
+
+    async def cmd(self, command: str) -> Optional[str]:
+        await self.send_command(command)
+        return await self.read_response()
+
+
+class AsyncWLANConnection(AsyncTCPConnection):
+    type = "wlan"
+    default_port = 8000
+    default_timeout = 1
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("ip", os.environ.get("ADDITEL_IP"))
+        super().__init__(**kwargs)
+
+
+class AsyncEthernetConnection(AsyncTCPConnection):
+    type = "ethernet"
+    default_port = 5025
+    default_timeout = 10
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if not self.ip:
+            raise ValueError("IP address is required for Ethernet connection.")
@@ -0,0 +1,48 @@
+# aio/module.py - asyncio version of the Module commands.
+from typing import TYPE_CHECKING, List
+
+from ..channel import DIFunctionChannelConfig
+from ..coerce import coerce
+from ..module import DIModuleInfo
+
+if TYPE_CHECKING:
+    from . import AsyncAdditel
+
+
+class AsyncModule:
+    """asyncio counterpart of :class:`~additel_sdk.module.Module`."""
+
+    def __init__(self, parent: "AsyncAdditel"):
+        self.parent = parent
+
+    async def info_str(self) -> List[DIModuleInfo]:
+        """Acquire module information."""
+        if response := await self.parent.cmd("MODule:INFormation?"):
+            return DIModuleInfo.from_str(response)
+        return []
+
+    async def info(self) -> List[DIModuleInfo]:
+        """Acquire module information, in JSON format."""
+        if response := await self.parent.cmd("JSON:MODule:INFormation?"):
+            return coerce(response)
+        raise ValueError("No module information received")
+
+    async def getConfiguration(self, module_index: int) -> List[DIFunctionChannelConfig]:
+        """Acquire channel configuration of a specified junction box."""
+        if module_index not in range(5):
+            raise ValueError("Module index must be between 0 and 4 inclusive.")
+        if response := await self.parent.cmd(f"MODule:CONFig? {module_index}"):
+            return DIFunctionChannelConfig.from_str(response)
+
+    async def getConfiguration_json(
+        self, module_index: int
+    ) -> List[DIFunctionChannelConfig]:
+        """Acquire channel configuration of the front panel, in JSON format."""
+        if module_index != 0:
+            raise ValueError(
+                "Only the front panel module can be queried in JSON format. "
+                "Use the getConfiguration method instead."
+            )
+        if response := await self.parent.cmd(f"JSON:MODule:CONFig? {module_index}"):
+            return coerce(response)
+        raise ValueError("No channel configuration received")
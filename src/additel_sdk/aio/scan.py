@@ -0,0 +1,76 @@
+# aio/scan.py - asyncio version of the Scan commands.
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, List
+
+from ..coerce import coerce
+from ..scan import DIReading, DIScanInfo
+
+if TYPE_CHECKING:
+    from . import AsyncAdditel
+
+
+class AsyncScan:
+    """asyncio counterpart of :class:`~additel_sdk.scan.Scan`."""
+
+    def __init__(self, parent: "AsyncAdditel"):
+        self.parent = parent
+
+    async def start(self, scan_info: DIScanInfo) -> None:
+        """Set the configuration and start scanning."""
+        await self.parent.send_command(f'SCAN:STARt "{scan_info}"')
+        await asyncio.sleep(scan_info.NPLC / 1000)
+
+    async def get_configuration(self) -> DIScanInfo:
+        """Acquire the scanning configuration."""
+        if response := await self.parent.cmd("SCAN:STARt?"):
+            return DIScanInfo.from_str(response)
+
+    async def get_configuration_json(self, measure=False) -> DIScanInfo:
+        """Acquire the scanning configuration, in JSON format."""
+        meas = "MEASure:" if measure else ""
+        if response := await self.parent.cmd(meas + "JSON:SCAN:STARt?"):
+            return coerce(response)
+
+    async def stop(self, measure=False) -> None:
+        """Stop any active scanning process on the device."""
+        meas = "MEASure:" if measure else ""
+        await self.parent.send_command(f"{meas}SCAN:STOP")
+
+    async def get_latest_data(self, longformat=True) -> List[DIReading]:
+        """Retrieve the latest scanning data for all active channels."""
+        response = await self.parent.cmd(f"SCAN:DATA:Last? {2 if longformat else 1}")
+        return DIReading.from_str(response)
+
+    async def get_data_json(self, count: int = 1) -> List[DIReading]:
+        """Acquire `count` scanning data points per channel, in JSON format."""
+        assert count > 0, "Count must be greater than 0."
+        if response := await self.parent.cmd(f"JSON:SCAN:DATA? {count}"):
+            return coerce(response)
+
+    async def start_multi_channel_scan(
+        self, channel_list: List[str], sampling_rate: int = 1000, measure: bool = False
+    ) -> None:
+        """Start scanning for multiple channels."""
+        meas = "MEASure:" if measure else ""
+        channels = ",".join(channel_list)
+        await self.parent.send_command(
+            f'{meas}SCAN:MULT:STARt {sampling_rate},"{channels}"'
+        )
+        await asyncio.sleep(len(channel_list) * sampling_rate / 1000 + 1)
+
+    @asynccontextmanager
+    async def preserve_scan_state(self):
+        original = await self.get_configuration()
+        if not original:
+            raise ValueError("No scan state to preserve.")
+        try:
+            yield
+        finally:
+            await self.start(original)
+
+    async def get_readings(self, desired_channels: List[str]) -> List[DIReading]:
+        """Scan the given channels and return the last reading from each."""
+        async with self.preserve_scan_state():
+            await self.start_multi_channel_scan(desired_channels)
+            return await self.get_data_json()
@@ -0,0 +1,54 @@
+# aio/system.py - asyncio version of the System commands.
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import AsyncAdditel
+
+
+class AsyncSystem:
+    """asyncio counterpart of :class:`~additel_sdk.system.System`."""
+
+    def __init__(self, parent: "AsyncAdditel"):
+        self.parent = parent
+
+    @staticmethod
+    def parse_error(response: str) -> dict:
+        if not response:
+            raise ValueError("No error information returned.")
+        parts = response.split(",")
+        return {"error_code": int(parts[0]), "error_message": parts[1].strip()}
+
+    async def get_version(self) -> str:
+        """Retrieve version information (SYSTem:VERSion?)."""
+        return await self.parent.cmd("SYSTem:VERSion?")
+
+    async def get_error(self, next=False) -> dict:
+        """Retrieve the next error in the system error queue."""
+        command = f"SYSTem:ERRor{':NEXT' if next else ''}?"
+        return self.parse_error(await self.parent.cmd(command))
+
+    async def set_date(self, year: int, month: int, day: int) -> None:
+        await self.parent.send_command(f"SYSTem:DATE {year},{month},{day}")
+
+    async def get_date(self) -> date:
+        if response := await self.parent.cmd("SYSTem:DATE?"):
+            return date(*map(int, response.split(",")))
+        raise ValueError("No date information returned.")
+
+    async def set_time(self, hour: int, minute: int, second: int) -> None:
+        await self.parent.send_command(f"SYSTem:TIME {hour},{minute},{second}")
+
+    async def set_local_lock(self, lock: bool) -> None:
+        await self.parent.send_command(f"SYSTem:KLOCk {int(lock)}")
+
+    async def get_local_lock(self) -> bool:
+        if response := await self.parent.cmd("SYSTem:KLOCk?"):
+            return bool(int(response.strip()))
+        raise ValueError("No lock state information returned.")
+
+    async def set_warning_tone(self, enable: bool) -> None:
+        await self.parent.send_command(f"SYSTem:BEEPer:ALARm {int(enable)}")
+
+    async def set_keypad_tone(self, enable: bool) -> None:
+        await self.parent.send_command(f"SYSTem:BEEPer:TOUCh {int(enable)}")
@@ -0,0 +1,49 @@
+# batch.py - Join queued SCPI commands into compound messages.
+from typing import List
+
+
+class CommandBatch:
+    """Queue of non-query commands to be sent as SCPI compound messages.
+
+    Commands are joined with ``;``. Every command after the first in a message is
+    prefixed with ``:`` so its header is resolved from the root of the command
+    tree instead of relative to the previous command. Common commands (``*CLS``)
+    are left as they are.
+
+    Args:
+        max_length (int): Maximum length of one compound message, in characters.
+            A single command longer than this is sent on its own.
+    """
+
+    def __init__(self, max_length: int = 256):
+        if max_length < 1:
+            raise ValueError("max_length must be positive.")
+        self.max_length = max_length
+        self.commands: List[str] = []
+
+    def __len__(self):
+        return len(self.commands)
+
+    def add(self, command: str) -> None:
+        self.commands.append(command.strip())
+
+    def clear(self) -> None:
+        self.commands.clear()
+
+    def messages(self) -> List[str]:
+        """Return the queued commands joined into compound messages."""
+        messages = []
+        current = ""
+        for command in self.commands:
+            if not current:
+                current = command
+                continue
+            part = command if command.startswith((":", "*")) else f":{command}"
+            if len(current) + 1 + len(part) > self.max_length:
+                messages.append(current)
+                current = command
+            else:
+                current = f"{current};{part}"
+        if current:
+            messages.append(current)
+        return messages
@@ -8,6 +8,8 @@ import logging
 if TYPE_CHECKING:
     from src.additel_sdk import Additel
 
+logger = logging.getLogger(__name__)
+
 
 @register_type("TAU.Module.Channels.DI.DIFunctionChannelConfig")
 @dataclass(kw_only=True)
@@ -280,12 +282,12 @@ class Channel:
             self.validate_name(name)
         names_str = ",".join(channel_names)
         if response := self.parent.cmd(f'CHANnel:CONFig:JSON? "{names_str}"'):
-            return coerce(response)
+            return self.parent.parse(coerce, response)
 
     def get_configuration(self, channel_name: str) -> List[DIFunctionChannelConfig]:
         self.validate_name(channel_name)
         if response := self.parent.cmd(f'CHANnel:CONFig? "{channel_name}"'):
-            return DIFunctionChannelConfig.from_str(response)
+            return self.parent.parse(DIFunctionChannelConfig.from_str, response)
 
     def configure(self, config: DIFunctionChannelConfig) -> None:
         """Set channel configuration.
@@ -293,7 +295,7 @@ class Channel:
         Args:
             config (DIFunctionChannelConfig): A channel configuration object.
         """
-        logging.warning("This function has not yet been tested.")
+        logger.warning("This function has not yet been tested.")
         command = f"CHANnel:CONFig {config};"
         self.parent.send_command(command)
 
@@ -1,7 +1,23 @@
-from typing import List, Union, Any
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Union
 import re
 from json import loads
 from .registry import TYPE_REGISTRY
+from .tracing import get_tracer, span
+
+LIST_INDICATOR = re.compile(r"""
+    System\.Collections\.Generic\.List`1\[\[   # Outer List
+    ([\w\.]+),\s+                              # Type name
+    ([\w\.]+)\]\],\s+                          # Namespace
+    ([\w\.]+)                                  # Assembly
+""", re.VERBOSE)
+
+# Keys that describe an object rather than hold one of its fields.
+_METADATA = ("$type", "ClassName")
+_SCALARS = (int, float, str, bool, "int", "float", "str", "bool")
+
+Decoder = Callable[[dict], Any]
+_decoders: Dict[str, Decoder] = {}
 
 
 def coerce(adt: Union[dict, str, list]) -> Any:
@@ -9,9 +25,12 @@ def coerce(adt: Union[dict, str, list]) -> Any:
     Dynamically coerces a dictionary-based object to its appropriate type
     using a provided type mapping.
 
+    A decoder is compiled once per `$type` string and cached, so the type name is
+    parsed and looked up in the registry only the first time it is seen. The
+    input is not modified.
+
     Args:
         adt (dict or str): The Additel-formatted data to coerce
-        date_format (str): Optional format string for parsing datetime objects.
 
     Returns:
         An instance of the type determined from the `$type` key in the dictionary.
@@ -19,41 +38,71 @@ def coerce(adt: Union[dict, str, list]) -> Any:
     Raises:
         TypeError: If `$type` is missing or not recognized in the provided map.
     """
+    if isinstance(adt, str):
+        with span("additel.coerce", payload_size=len(adt)) as trace:
+            result = _decode(loads(adt))
+            if isinstance(result, list):
+                trace.set_attribute("channel_count", len(result))
+        return result
+    return _decode(adt)
 
-    def _coerce_list(adt: list):
-        return [coerce(v) if isinstance(v, dict) else v for v in adt]
 
-    if isinstance(adt, list):
-        return _coerce_list(adt)
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        type_str = value.get("$type")
+        if not type_str:
+            # Prevent an infinite loop by returning the dictionary if no type is specified
+            return value
+        decoder = _decoders.get(type_str) or _compile(type_str)
+        return decoder(value)
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
 
-    if isinstance(adt, str):
-        adt = loads(adt)
-
-    typeStr = adt.pop("$type", None)
-    if not typeStr:
-        # Prevent an infinite loop by returning the dictionary if no type is specified
-        return adt
-
-    ClassName = adt.pop("ClassName", None)  # noqa: F841
-    listIndicator = re.compile(r"""
-        System\.Collections\.Generic\.List`1\[\[   # Outer List
-        ([\w\.]+),\s+                              # Type name
-        ([\w\.]+)\]\],\s+                          # Namespace
-        ([\w\.]+)                                  # Assembly
-    """, re.VERBOSE)
-    if match := re.match(listIndicator, typeStr):
-        typ = List[TYPE_REGISTRY[match.group(1)]]
-        adt = adt["$values"]
-        return _coerce_list(adt)
-
-    typeStr0 = typeStr.split(",")[0]
-
-    if typ := TYPE_REGISTRY.get(typeStr0, None):
-        for key, value in adt.items():
-            if isinstance(value, dict):
-                adt[key] = coerce(value)
-            elif isinstance(value, list):
-                adt[key] = _coerce_list(value)
-
-        return typ(**adt)  # Instantiate the type with the coerced dictionary
-    raise TypeError(f"Type not found in mapping: {typeStr0}")
+
+def _compile(type_str: str) -> Decoder:
+    """Build the decoder for a `$type` string and cache it."""
+    if match := LIST_INDICATOR.match(type_str):
+        element = TYPE_REGISTRY.get(match.group(1))
+        if element in (float, int, str):
+            decoder = _decode_scalar_list
+        else:
+            decoder = _decode_list
+    else:
+        name = type_str.split(",")[0]
+        cls = TYPE_REGISTRY.get(name)
+        if cls is None:
+            raise TypeError(f"Type not found in mapping: {name}")
+        decoder = _object_decoder(cls, name)
+    _decoders[type_str] = decoder
+    return decoder
+
+
+def _decode_scalar_list(value: dict) -> list:
+    return list(value["$values"])
+
+
+def _decode_list(value: dict) -> list:
+    return [_decode(v) for v in value["$values"]]
+
+
+def _object_decoder(cls, name: str) -> Decoder:
+    # Fields declared with a scalar type are copied as they are; every other
+    # field may hold a nested object or list and goes through _decode.
+    scalar_fields = frozenset(
+        f.name for f in fields(cls) if f.type in _SCALARS
+    ) if is_dataclass(cls) else frozenset()
+
+    def decode(value: dict):
+        kwargs = {
+            key: item if key in scalar_fields else _decode(item)
+            for key, item in value.items()
+            if key not in _METADATA
+        }
+        tracer = get_tracer()
+        if tracer.enabled:
+            with tracer.start_span("additel.construct", type=name):
+                return cls(**kwargs)
+        return cls(**kwargs)  # Instantiate the type with the coerced dictionary
+
+    return decode
@@ -0,0 +1,199 @@
+# columnar.py - Scan data held in contiguous NumPy arrays.
+"""A :class:`DIReadingBatch` keeps the samples of every channel in a few
+``float64`` and ``int64`` arrays instead of one Python object per value, so a
+sample takes tens of bytes rather than hundreds and statistics are vectorized::
+
+    batch = device.Scan.get_data_batch(1000)
+    ref = batch.channel_slice("REF1")
+    batch.temp_values[ref].mean()
+
+NumPy is optional; it is only needed to build a batch.
+"""
+
+from dataclasses import fields
+from json import loads
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from .registry import TYPE_REGISTRY
+from .TimeTick import TimeTick, parse_ticks, to_datetime64
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is an optional dependency
+    np = None
+
+# List fields of the DIReading classes held as float64 columns, by attribute.
+COLUMNS = {
+    "Values": "values",
+    "ValuesFiltered": "values_filtered",
+    "TempValues": "temp_values",
+    "CJCs": "cjcs",
+    "CjcRaws": "cjc_raws",
+}
+_LISTS = ("DateTimeTicks", *COLUMNS)
+_METADATA = ("$type", "ClassName")
+
+# (reading class, scalar fields, .NET ticks, list fields) of one channel
+_Channel = Tuple[type, Dict[str, Any], Sequence[int], Dict[str, Sequence[float]]]
+
+
+class DIReadingBatch:
+    """Scan data of several channels in columnar form.
+
+    The samples of all channels are concatenated, channel by channel; channel
+    ``i`` occupies ``offsets[i]:offsets[i + 1]`` of every column. A column the
+    channel's reading type does not have (e.g. ``cjcs`` of a reference channel)
+    holds NaN for its samples.
+
+    Attributes:
+        names (tuple[str]): Channel names, one per channel.
+        units (numpy.ndarray): ``int64`` unit of each channel's values.
+        temp_units (numpy.ndarray): ``int64`` unit of each channel's temperatures.
+        offsets (numpy.ndarray): ``int64`` start of each channel's samples, and
+            the total number of samples last.
+        ticks (numpy.ndarray): ``int64`` .NET ticks of each sample.
+        values, values_filtered, temp_values, cjcs, cjc_raws (numpy.ndarray):
+            ``float64`` samples.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+
+    def __init__(self, channels: Iterable[_Channel]):
+        if np is None:
+            raise ImportError("DIReadingBatch requires NumPy (pip install numpy).")
+        names, units, temp_units, counts, ticks = [], [], [], [], []
+        columns: Dict[str, list] = {name: [] for name in COLUMNS}
+        self._metadata: List[Tuple[type, Dict[str, Any], Tuple[str, ...]]] = []
+        for cls, scalars, channel_ticks, lists in channels:
+            name = scalars["ChannelName"]
+            count = len(lists.get("Values", ()))
+            if len(channel_ticks) != count:
+                raise ValueError(
+                    f"{name} has {len(channel_ticks)} ticks for {count} values."
+                )
+            present = []
+            for key, column in columns.items():
+                samples = lists.get(key) or ()
+                if not samples and key != "Values":
+                    column.append(np.full(count, np.nan))
+                    continue
+                if len(samples) != count:
+                    raise ValueError(
+                        f"{name} has {len(samples)} {key} for {count} values."
+                    )
+                column.append(np.asarray(samples, dtype=np.float64))
+                present.append(key)
+            names.append(name)
+            units.append(scalars.get("Unit", 0))
+            temp_units.append(scalars.get("TempUnit", 0))
+            counts.append(count)
+            ticks.append(np.asarray(channel_ticks, dtype=np.int64))
+            self._metadata.append((cls, scalars, tuple(present)))
+
+        self.names = tuple(names)
+        self.units = np.array(units, dtype=np.int64)
+        self.temp_units = np.array(temp_units, dtype=np.int64)
+        self.offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+        self.ticks = _concatenate(ticks, np.int64)
+        for key, attribute in COLUMNS.items():
+            setattr(self, attribute, _concatenate(columns[key], np.float64))
+
+    @classmethod
+    def from_readings(cls, readings: Iterable) -> "DIReadingBatch":
+        """Build a batch from DIReading objects (e.g. from `get_data_json`)."""
+        return cls(
+            (
+                type(reading),
+                {f.name: getattr(reading, f.name) for f in fields(reading)
+                 if f.name not in _LISTS},
+                [tick.to_ticks() for tick in reading.DateTimeTicks],
+                {key: getattr(reading, key) for key in COLUMNS if hasattr(reading, key)},
+            )
+            for reading in readings
+        )
+
+    @classmethod
+    def from_json(cls, response: str) -> "DIReadingBatch":
+        """Build a batch straight from a ``JSON:SCAN:DATA?`` response.
+
+        No DIReading or TimeTick objects are created.
+        """
+        channels = []
+        for item in loads(response)["$values"]:
+            reading_type = TYPE_REGISTRY.get(item["$type"].split(",")[0])
+            if reading_type is None:
+                raise TypeError(f"Type not found in mapping: {item['$type']}")
+            scalars, lists = {}, {}
+            for key, value in item.items():
+                if key in _METADATA:
+                    continue
+                if isinstance(value, dict):
+                    lists[key] = value.get("$values", ())
+                else:
+                    scalars[key] = value
+            ticks = [parse_ticks(t["TickTime"]) for t in lists.pop("DateTimeTicks", ())]
+            channels.append((reading_type, scalars, ticks, lists))
+        return cls(channels)
+
+    @classmethod
+    def from_str(cls, response: str) -> "DIReadingBatch":
+        """Build a batch from a ``SCAN:DATA:Last?`` response.
+
+        The fields of each channel go straight into the columns; no DIReading
+        or TimeTick objects are created.
+        """
+        from .scan import split_readings  # scan imports this module
+
+        channels = []
+        for reading_type, row in split_readings(response):
+            scalars = reading_type.arguments(row)
+            lists = {key: scalars.pop(key) for key in COLUMNS if key in scalars}
+            channels.append((reading_type, scalars, [parse_ticks(row[3])], lists))
+        return cls(channels)
+
+    def to_readings(self) -> list:
+        """Rebuild the DIReading objects held in the batch."""
+        readings = []
+        for i, (cls, scalars, present) in enumerate(self._metadata):
+            window = self.channel_slice(i)
+            lists = {
+                key: getattr(self, COLUMNS[key])[window].tolist() for key in present
+            }
+            ticks = [TimeTick(t) for t in self.ticks[window].tolist()]
+            readings.append(cls(**scalars, DateTimeTicks=ticks, **lists))
+        return readings
+
+    def __len__(self) -> int:
+        """Number of channels."""
+        return len(self.names)
+
+    @property
+    def sample_count(self) -> int:
+        return int(self.offsets[-1])
+
+    @property
+    def codes(self):
+        """``int64`` index into `names` of each sample's channel."""
+        return np.repeat(np.arange(len(self.names)), np.diff(self.offsets))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the per-sample arrays."""
+        return self.ticks.nbytes + sum(
+            getattr(self, attribute).nbytes for attribute in COLUMNS.values()
+        )
+
+    def channel_slice(self, channel) -> slice:
+        """Return the slice of every column holding `channel` (name or index)."""
+        index = self.names.index(channel) if isinstance(channel, str) else channel
+        return slice(int(self.offsets[index]), int(self.offsets[index + 1]))
+
+    def timestamps(self, unit: str = "ns"):
+        """Return the sample times as a ``datetime64`` array."""
+        return to_datetime64(self.ticks).astype(f"datetime64[{unit}]")
+
+
+def _concatenate(arrays: list, dtype):
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
@@ -3,6 +3,7 @@ from .bluetooth import BluetoothConnection
 from .ethernet import EthernetConnection
 from .mock import MockConnection
 from .serial import SerialConnection
+from .tcp import TCPConnection
 from .usb import USBConnection
 from .wlan import WLANConnection
 
@@ -12,6 +13,7 @@ __all__ = [
     "EthernetConnection",
     "MockConnection",
     "SerialConnection",
+    "TCPConnection",
     "USBConnection",
     "WLANConnection",
 ]
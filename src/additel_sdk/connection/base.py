@@ -1,8 +1,11 @@
 # connection/base.py
+from typing import Iterator
+from .framing import JSONValuesStreamer
 
 
 class Connection:
     registry = {}
+    pipelining = False  # Whether responses can be read after several writes
 
     def __init_subclass__(cls, **kwargs):
         """Automatically register subclasses using their `type` attribute."""
@@ -40,6 +43,11 @@ class Connection:
     def read_response(self):
         raise NotImplementedError
 
+    def send_many(self, commands):
+        """Send several commands without waiting for their responses."""
+        for command in commands:
+            self.send_command(command)
+
     def cmd(self, command):
         self.send_command(command)
         return self.read_response()
@@ -47,3 +55,14 @@ class Connection:
     @classmethod
     def available_types(cls):
         return list(cls.registry.keys())
+
+    def read_json_values(self) -> Iterator[bytes]:
+        """Yield each element of a JSON list response as raw bytes.
+
+        This default reads the whole response first; transports that can do
+        better yield each element as soon as it has been received.
+        """
+        streamer = JSONValuesStreamer()
+        if response := self.read_response():
+            streamer.feed(response.encode("utf-8"))
+        yield from streamer
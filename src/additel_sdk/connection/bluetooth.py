@@ -1,27 +1,79 @@
 import asyncio
+import threading
+from time import monotonic
 from bleak import BleakClient, BleakScanner
-from queue import Queue, Empty
 from . import Connection
+from .framing import ResponseFramer
 
 
 class BluetoothConnection(Connection):
-    """Class to handle Bluetooth connection to the device."""
+    """Class to handle Bluetooth connection to the device.
+
+    Bleak is asynchronous, so each connection runs one long-lived event loop in a
+    background thread and submits coroutines to it with
+    ``asyncio.run_coroutine_threadsafe``. The BleakClient stays bound to that loop
+    for the lifetime of the connection. GATT notifications are reassembled into
+    complete responses in a :class:`ResponseFramer` buffer.
+    """
 
     type = "bluetooth"
+    partial_timeout = 0.1  # Wait this long for the end of an unterminated reply
 
     def __init__(self, parent, **kwargs):
+        self.parent = parent
         self.device_name = kwargs.get("device_name")
         self.notification_uuid = kwargs.get("notification_uuid")
         self.write_uuid = kwargs.get("write_uuid")
+        self.timeout = kwargs.get("timeout", 5)
+        self.encoding = kwargs.get("encoding", "utf-8")
         self.client = None
-        self.response_queue = Queue()
+        self._loop = None
+        self._thread = None
+        self._framer = ResponseFramer()
+        self._received = threading.Condition()
 
         if not self.device_name:
             raise ValueError("Device name must be specified for Bluetooth connection.")
 
+    def _start_loop(self):
+        if self._loop is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name=f"BluetoothConnection-{self.device_name}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _stop_loop(self):
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def _run(self, coroutine):
+        """Run a coroutine on the connection's event loop and wait for its result."""
+        if self._loop is None:
+            coroutine.close()
+            raise ConnectionError("Bluetooth connection is not established.")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
     def __enter__(self):
         """Establish a Bluetooth connection to the device."""
-        asyncio.run(self._connect_async())
+        self._start_loop()
+        self._framer.clear()
+        try:
+            self._run(self._connect_async())
+            if self.notification_uuid:
+                self.enable_notifications()
+        except Exception:
+            self._stop_loop()
+            raise
+        return self
 
     async def _connect_async(self):
         devices = await BleakScanner.discover()
@@ -29,56 +81,71 @@ class BluetoothConnection(Connection):
             if device.name == self.device_name:
                 self.client = BleakClient(device)
                 try:
-                    await self.client.__enter__()
+                    await self.client.connect()
                     return
                 except Exception as e:
                     raise ConnectionError(
-                        f"Failed to __enter__ to Bluetooth device '{self.device_name}' - {e}"
+                        f"Failed to connect to Bluetooth device '{self.device_name}' - {e}"
                     )
         raise ConnectionError(f"Bluetooth device '{self.device_name}' not found.")
 
-    def __exit__(self):
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None):
         """Close the Bluetooth connection."""
-        asyncio.run(self._disconnect_async())
+        try:
+            if self._loop is not None:
+                self._run(self._disconnect_async())
+        finally:
+            self._stop_loop()
 
     async def _disconnect_async(self):
         if self.client and self.client.is_connected:
             try:
-                await self.client.__exit__()
+                await self.client.disconnect()
                 self.client = None
             except Exception as e:
-                raise ConnectionError(f"Failed to __exit__ from Bluetooth device - {e}")
+                raise ConnectionError(f"Failed to disconnect from Bluetooth device - {e}")
 
     def send_command(self, command):
         """Send a command to the Bluetooth device."""
-        asyncio.run(self._send_command_async(command))
+        self._run(self._send_command_async(command))
 
     async def _send_command_async(self, command):
         if not self.client or not self.client.is_connected:
             raise ConnectionError("Bluetooth connection is not established.")
 
         try:
-            command_in_bytes = bytes(command, "utf-8")
+            command_in_bytes = bytes(command, self.encoding)
             await self.client.write_gatt_char(self.write_uuid, command_in_bytes)
         except Exception as e:
             raise IOError(f"Failed to send command '{command}' - {e}")
 
-    def read_response(self, timeout=5):
-        """Read response from the Bluetooth device."""
-        try:
-            response = self.response_queue.get(timeout=timeout)
-            return response
-        except Empty:
-            raise TimeoutError("No response received within the timeout period.")
-
-    async def _notification_handler(self, sender, data):
-        """Handle incoming notifications from the device."""
-        response = data.decode("utf-8")
-        self.response_queue.put(response)
+    def read_response(self, timeout=None):
+        """Read one complete response from the Bluetooth device."""
+        deadline = monotonic() + (self.timeout if timeout is None else timeout)
+        with self._received:
+            while (frame := self._framer.pop()) is None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        "No response received within the timeout period."
+                    )
+                if len(self._framer):
+                    # Once packets stop arriving, accept an unterminated text reply.
+                    remaining = min(remaining, self.partial_timeout)
+                if not self._received.wait(remaining):
+                    if (frame := self._framer.pop_partial()) is not None:
+                        break
+        return frame.decode(self.encoding, errors="replace")
+
+    def _notification_handler(self, sender, data):
+        """Append a GATT notification packet to the response buffer."""
+        with self._received:
+            self._framer.feed(data)
+            self._received.notify_all()
 
     def enable_notifications(self):
         """Enable notifications for reading responses."""
-        asyncio.run(self._enable_notifications_async())
+        self._run(self._enable_notifications_async())
 
     async def _enable_notifications_async(self):
         if not self.client or not self.client.is_connected:
@@ -93,7 +160,7 @@ class BluetoothConnection(Connection):
 
     def disable_notifications(self):
         """Disable notifications."""
-        asyncio.run(self._disable_notifications_async())
+        self._run(self._disable_notifications_async())
 
     async def _disable_notifications_async(self):
         if not self.client or not self.client.is_connected:
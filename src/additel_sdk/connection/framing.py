@@ -0,0 +1,238 @@
+# connection/framing.py - Split the device's byte stream into complete responses.
+import re
+from typing import Optional
+
+# Bytes that change the state of the JSON scanner, outside and inside a string.
+_STRUCTURAL = re.compile(rb'[{}\[\]"]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+
+
+class _BracketScanner:
+    """Find the brackets of a JSON document that are not inside a string.
+
+    The string and escape state is kept between calls, so a document received
+    in chunks is scanned in a single pass.
+
+    Attributes:
+        pos (int): Next index of the buffer to scan.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.pos = 0
+        self._in_string = False
+        self._escape = False
+
+    def next_bracket(self, buf: bytearray) -> Optional[int]:
+        """Return the index of the next bracket, or None once `buf` is exhausted.
+
+        `pos` is left just past the returned bracket.
+        """
+        pos = self.pos
+        while True:
+            if self._in_string:
+                if self._escape:
+                    if pos >= len(buf):
+                        break
+                    self._escape = False
+                    pos += 1
+                    continue
+                match = _STRING_SPECIAL.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                pos = match.end()
+                if match.group() == b"\\":
+                    self._escape = True
+                else:
+                    self._in_string = False
+                continue
+
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            pos = match.end()
+            if match.group() == b'"':
+                self._in_string = True
+                continue
+            self.pos = pos
+            return match.start()
+        self.pos = pos
+        return None
+
+
+class ResponseFramer:
+    """Incrementally locate response boundaries in a stream of received bytes.
+
+    Responses are either a JSON document (the first non-whitespace byte is ``{``)
+    or a line of text ended by ``terminator``. Received bytes are appended to a
+    single ``bytearray`` and every byte is scanned at most once: the scanner keeps
+    its nesting depth and string/escape state between calls to :meth:`feed`, so the
+    end of a multi-megabyte ``JSON:SCAN:DATA?`` reply is found in linear time
+    without re-parsing the partial document after every ``recv``.
+
+    Any bytes received after the end of a frame are kept for the next frame.
+    """
+
+    def __init__(self, terminator: bytes = b"\n"):
+        self.terminator = terminator
+        self.buffer = bytearray()
+        self._scanner = _BracketScanner()
+        self._reset()
+
+    def _reset(self):
+        self._started = False  # A frame begins at the start of the buffer
+        self._pos = 0  # Next index to scan for the text terminator
+        self._json = False
+        self._depth = 0
+        self._scanner.reset()
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def feed(self, data: bytes) -> None:
+        """Append received bytes to the buffer."""
+        self.buffer += data
+
+    def clear(self) -> None:
+        """Discard all buffered bytes and scanner state."""
+        self.buffer.clear()
+        self._reset()
+
+    def pop(self) -> Optional[bytes]:
+        """Remove and return the next complete frame, or None if it is incomplete.
+
+        The returned frame has surrounding whitespace removed.
+        """
+        if not self._started and not self._find_start():
+            return None
+        end = self._scan_json() if self._json else self._scan_text()
+        if end is None:
+            return None
+        return self._take(end)
+
+    @property
+    def pending_text(self) -> bool:
+        """True if the buffered start of a frame is text rather than JSON."""
+        if not self._started:
+            self._find_start()
+        return self._started and not self._json
+
+    def pop_partial(self) -> Optional[bytes]:
+        """Return a buffered text response that has no terminator yet.
+
+        Some replies are not followed by a line terminator. Once the socket has
+        nothing more to deliver, the caller may accept whatever text has arrived.
+        Incomplete JSON documents are never returned.
+        """
+        if not self._started and not self._find_start():
+            return None
+        if self._json:
+            return None
+        return self._take(len(self.buffer))
+
+    def _find_start(self) -> bool:
+        buf = self.buffer
+        i = 0
+        while i < len(buf) and buf[i] in _WHITESPACE:
+            i += 1
+        if i:
+            del buf[:i]
+        if not buf:
+            return False
+        self._started = True
+        self._pos = 0
+        self._json = buf[0] == ord("{")
+        return True
+
+    def _scan_text(self) -> Optional[int]:
+        idx = self.buffer.find(self.terminator, self._pos)
+        if idx < 0:
+            # The terminator may straddle the boundary with the next chunk.
+            self._pos = max(0, len(self.buffer) - len(self.terminator) + 1)
+            return None
+        return idx + len(self.terminator)
+
+    def _scan_json(self) -> Optional[int]:
+        buf = self.buffer
+        while (index := self._scanner.next_bracket(buf)) is not None:
+            if buf[index] in b"{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return self._scanner.pos
+        return None
+
+    def _take(self, end: int) -> bytes:
+        frame = bytes(self.buffer[:end]).strip()
+        del self.buffer[:end]
+        self._reset()
+        return frame
+
+
+class JSONValuesStreamer:
+    """Split the ``$values`` array of a JSON list response into its elements.
+
+    List responses look like ``{"$type": "...List`1[[...]]...", "$values": [{...},
+    {...}]}``. Bytes are fed as they arrive and each element of the array is
+    returned by :meth:`pop` as soon as its closing brace has been received, using
+    the same single-pass scanner as :class:`ResponseFramer`. Bytes before the
+    current element are discarded, so memory is bounded by the largest element
+    rather than the whole response.
+
+    Once the outer object is closed, :attr:`done` is True and any bytes received
+    after it are available in :attr:`leftover`.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.done = False
+        self._scanner = _BracketScanner()
+        self._containers = bytearray()  # Opening bracket of each open container
+        self._element_start = None
+
+    def feed(self, data: bytes) -> None:
+        self.buffer += data
+
+    @property
+    def leftover(self) -> bytes:
+        return bytes(self.buffer[self._scanner.pos:]) if self.done else b""
+
+    def __iter__(self):
+        while (element := self.pop()) is not None:
+            yield element
+
+    def pop(self) -> Optional[bytes]:
+        """Return the next complete element of ``$values``, or None."""
+        buf = self.buffer
+        scanner = self._scanner
+        while not self.done:
+            start = scanner.next_bracket(buf)
+            if start is None:
+                break
+            char = buf[start]
+            if char in b"{[":
+                # An element opens inside the array held by the outer object.
+                if self._containers == b"{[":
+                    self._element_start = start
+                self._containers.append(char)
+            else:
+                del self._containers[-1]
+                if self._containers == b"{[" and self._element_start is not None:
+                    element = bytes(buf[self._element_start:scanner.pos])
+                    del buf[:scanner.pos]
+                    scanner.pos = 0
+                    self._element_start = None
+                    return element
+                if not self._containers:
+                    self.done = True
+        if self._element_start is None and not self.done:
+            # Nothing before `pos` is needed any more.
+            del buf[:scanner.pos]
+            scanner.pos = 0
+        return None
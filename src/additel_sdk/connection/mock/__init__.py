@@ -2,6 +2,8 @@
 
 import json
 from ..base import Connection
+from ...scpi import is_scan_start
+from .synth import default_channels, respond, scan_channels
 import os
 from typing import TYPE_CHECKING
 
@@ -14,6 +16,16 @@ class MockConnection(Connection):
 
     This connection type uses pre-defined responses from a JSON file to simulate
     device behavior without requiring an actual physical connection.
+
+    Responses recorded through the WLAN fallback are appended to a JSON Lines
+    journal next to the response file, so recording costs the same however large
+    the file grows. The journal is replayed into the in-memory table on
+    ``__enter__`` and compacted into the response file on ``__exit__``.
+
+    Queries missing from the table are sent to the device when the WLAN fallback
+    is enabled. Otherwise they are answered by the pattern-matched handlers in
+    :mod:`.synth`, e.g. ``JSON:SCAN:DATA? 500`` for the channels of the last
+    scan start command, or ``CHANnel:CONFig:JSON?`` for any subset of channels.
     """
 
     type = "mock"
@@ -23,32 +35,36 @@ class MockConnection(Connection):
     def __init__(self, parent: "Additel", **kwargs):
         self.parent = parent
         self.connected = False
+        self.last_command = None
         self.ip = kwargs.pop("ip", os.environ.get("ADDITEL_IP"))
         self.use_wlan_fallback = kwargs.pop("use_wlan_fallback")
 
     def __enter__(self):
         """Simulates connecting to the device."""
-        if not MockConnection.responses:
-            filepath = os.path.join(os.path.dirname(__file__), self.response_file)
-            with open(filepath) as f:
-                MockConnection.responses[self.response_file] = json.load(f)
+        if self.response_file not in MockConnection.responses:
+            MockConnection.responses[self.response_file] = self.load_responses()
         self.responses = MockConnection.responses[self.response_file]
+        self.channels = default_channels(self.responses)
         self.connected = True
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Simulates disconnecting from the device."""
         self.connected = False
+        self.compact()
 
     def send_command(self, command: str) -> None:
         """Stores the command to be processed by read_response."""
         if not self.connected:
             raise ConnectionError("Not connected to device")
+        self.last_command = command
+        if is_scan_start(command):
+            self.channels = scan_channels(command) or self.channels
 
     def read_response(self) -> str:
         """Returns the pre-defined or fallback response for the last command."""
 
-        last_command = self.parent.command_log[-1]
+        last_command = self.last_command
         if last_command == "SYSTem:DATE?":
             from datetime import date
 
@@ -66,19 +82,59 @@ class MockConnection(Connection):
                     self.responses[last_command] = response
                     self.save_response(last_command, response)
                     return response
+            return None
+
+        return respond(last_command, self)
+
+    @classmethod
+    def _filepath(cls) -> str:
+        return os.path.join(os.path.dirname(__file__), cls.response_file)
+
+    @classmethod
+    def _journal_path(cls) -> str:
+        return os.path.splitext(cls._filepath())[0] + ".jsonl"
+
+    @classmethod
+    def load_responses(cls) -> dict:
+        """Load the response file and replay any journaled recordings over it."""
+        with open(cls._filepath()) as f:
+            responses = json.load(f)
+        try:
+            with open(cls._journal_path()) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # A torn final line from an interrupted session
+                    responses[entry["command"]] = entry["response"]
+        except FileNotFoundError:
+            pass
+        return responses
 
     @classmethod
     def save_response(cls, command, response):
-        """Saves the command and response to the JSON file."""
-        filepath = os.path.join(os.path.dirname(__file__), cls.response_file)
+        """Appends the command and response to the journal."""
+        entry = json.dumps({"command": command, "response": response})
+        try:
+            with open(cls._journal_path(), "a") as f:
+                f.write(entry + "\n")
+        except Exception as e:
+            print(f"Error saving response to journal: {e}")
+
+    @classmethod
+    def compact(cls):
+        """Merges the journal into the JSON response file and removes it."""
+        journal = cls._journal_path()
+        if not os.path.exists(journal):
+            return
+        filepath = cls._filepath()
         try:
-            with open(filepath, "r+") as f:
-                data = json.load(f)
-                data[command] = response
-                f.seek(0)
+            data = cls.load_responses()
+            with open(filepath + ".tmp", "w") as f:
                 json.dump(data, f, indent=4)
-                f.truncate()
+            os.replace(filepath + ".tmp", filepath)
+            os.remove(journal)
         except FileNotFoundError:
             print(f"Warning: Response file not found: {cls.response_file}")
         except Exception as e:
-            print(f"Error saving response to file: {e}")
+            print(f"Error compacting response journal: {e}")
@@ -0,0 +1,213 @@
+# connection/mock/server.py - Local TCP simulator of an Additel device.
+"""Serve the SCPI line protocol on a local port from the mock response table.
+
+The real :class:`WLANConnection` and :class:`EthernetConnection` can connect to
+the simulator, which makes it possible to exercise and benchmark the socket code
+paths without hardware::
+
+    python -m src.additel_sdk.connection.mock.server --port 8000 --latency 0.01
+
+or from Python::
+
+    with DeviceSimulator(latency=0.005) as simulator:
+        with Additel("wlan", ip=simulator.host, port=simulator.port) as device:
+            device.Scan.get_data_json(500)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import threading
+from typing import Dict, List, Optional, Union
+from ...scpi import header, is_query, is_scan_start
+from . import MockConnection
+from .synth import default_channels, respond, scan_channels
+
+
+class DeviceSimulator:
+    """Asyncio TCP server that answers SCPI commands like an Additel device.
+
+    Queries are looked up in the response table (``mockADT286.json`` by default),
+    and those without a recording are answered by the pattern-matched handlers in
+    :mod:`.synth`, the same order as :class:`MockConnection`. So scan data for
+    ``JSON:SCAN:DATA? N`` and ``SCAN:DATA:Last? <1|2>`` is synthesized for any
+    unrecorded N, and for every N once a scan start command has named channels
+    other than the recorded ones. Unknown
+    queries get no reply, like the device, and queue error -113 for
+    ``SYSTem:ERRor?``.
+
+    Args:
+        responses (dict): Command to response table. Defaults to the contents of
+            the mock response file.
+        host (str): Interface to listen on.
+        port (int): Port to listen on; 0 picks a free port.
+        latency (float | dict): Seconds to wait before each reply, either one
+            value for every query or a mapping of command header to seconds.
+            Headers missing from the mapping use the ``"*"`` entry, if any.
+        chunk_size (int): If set, write replies in chunks of this many bytes.
+        chunk_delay (float): Seconds to wait between chunks.
+    """
+
+    def __init__(
+        self,
+        responses: Optional[Dict[str, str]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Union[float, Dict[str, float]] = 0.0,
+        chunk_size: Optional[int] = None,
+        chunk_delay: float = 0.0,
+    ):
+        if responses is None:
+            filepath = os.path.join(
+                os.path.dirname(__file__), MockConnection.response_file
+            )
+            with open(filepath) as f:
+                responses = json.load(f)
+        self.responses = responses
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.channels = self._recorded_channels = default_channels(responses)
+        self.errors: List[str] = []
+        self.clients = 0
+        self._server = None
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None):
+        self.stop()
+
+    def start(self) -> None:
+        """Start serving on a background thread and wait until listening."""
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._listen())
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="DeviceSimulator", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def stop(self) -> None:
+        """Close the server and all client connections."""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    async def _listen(self) -> None:
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _close(self) -> None:
+        self._server.close()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+        await self._server.wait_closed()
+
+    async def serve_forever(self) -> None:
+        """Serve on the current event loop until cancelled."""
+        await self._listen()
+        print(f"Device simulator listening on {self.host}:{self.port}")
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _serve(self, reader, writer) -> None:
+        self.clients += 1
+        try:
+            while line := await reader.readline():
+                for command in line.decode("utf-8", errors="replace").split(";"):
+                    if not (command := command.strip().lstrip(":")):
+                        continue
+                    response = self.handle(command)
+                    if response is None:
+                        continue
+                    if delay := self._latency(command):
+                        await asyncio.sleep(delay)
+                    await self._write(writer, (response + "\n").encode("utf-8"))
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    def _latency(self, command: str) -> float:
+        if isinstance(self.latency, dict):
+            name = header(command)
+            return self.latency.get(name, self.latency.get("*", 0.0))
+        return self.latency
+
+    async def _write(self, writer, data: bytes) -> None:
+        if not self.chunk_size:
+            writer.write(data)
+            await writer.drain()
+            return
+        for i in range(0, len(data), self.chunk_size):
+            if i and self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+            writer.write(data[i:i + self.chunk_size])
+            await writer.drain()
+
+    def handle(self, command: str) -> Optional[str]:
+        """Update the simulated state for a command and return its reply, if any."""
+        if is_scan_start(command):
+            self.channels = scan_channels(command) or self.channels
+        if not is_query(command):
+            return None
+
+        if header(command).upper() in {"SYST:ERR?", "SYSTEM:ERROR?"}:
+            return self.errors.pop(0) if self.errors else '0,"No error"'
+        # Recorded scan data is of the recorded channels only.
+        if self.channels != self._recorded_channels:
+            if (response := respond(command, self)) is not None:
+                return response
+        if (response := self.responses.get(command)) is not None:
+            return response
+        if (response := respond(command, self)) is not None:
+            return response
+        self.errors.append('-113,"Undefined header"')
+        return None
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Seconds to wait before each reply.")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Write replies in chunks of this many bytes.")
+    parser.add_argument("--chunk-delay", type=float, default=0.0,
+                        help="Seconds to wait between chunks.")
+    args = parser.parse_args(argv)
+    simulator = DeviceSimulator(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        chunk_size=args.chunk_size,
+        chunk_delay=args.chunk_delay,
+    )
+    try:
+        asyncio.run(simulator.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
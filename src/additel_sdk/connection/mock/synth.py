@@ -0,0 +1,184 @@
+# connection/mock/synth.py - Synthesize scan data responses at any size.
+import json
+import math
+import re
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Match, Optional, Pattern, Tuple
+from ...TimeTick import TimeTick
+
+_LIST = "System.Collections.Generic.List`1[[{}]], mscorlib"
+_CHANNELS = "TAU.Module.Channels"
+_DOUBLES = _LIST.format("System.Double, mscorlib")
+_TICKS = _LIST.format(f"{_CHANNELS}.DI.TimeTick, {_CHANNELS}")
+_READINGS = _LIST.format(f"{_CHANNELS}.DI.DIReading, {_CHANNELS}")
+
+# Nominal electrical and temperature values, and units, per kind of channel.
+_REFERENCE = {"Unit": 1281, "Value": 109.06, "TempUnit": 1001, "Temp": 22.55}
+_THERMOCOUPLE = {"Unit": 1243, "Value": 0.98, "TempUnit": 1001, "Temp": 24.6}
+
+
+def _is_reference(channel: str) -> bool:
+    return channel.startswith("REF")
+
+
+def _sample(channel: str, index: int):
+    """Return deterministic (value, filtered, temperature) for one sample."""
+    nominal = _REFERENCE if _is_reference(channel) else _THERMOCOUPLE
+    offset = sum(map(ord, channel)) % 17
+    wobble = math.sin((index + offset) / 7) * 1e-3
+    value = nominal["Value"] + wobble
+    filtered = nominal["Value"] + wobble * 0.8
+    temp = nominal["Temp"] + wobble * 250
+    return value, filtered, temp
+
+
+def _timestamps(count: int, end: datetime, interval: float) -> List[datetime]:
+    # The device lists the newest sample first.
+    step = timedelta(seconds=interval)
+    end = end.replace(microsecond=end.microsecond // 1000 * 1000)
+    return [end - i * step for i in range(count)]
+
+
+def scan_data_json(
+    channels: List[str],
+    count: int,
+    end: Optional[datetime] = None,
+    interval: float = 1.0,
+) -> str:
+    """Build a ``JSON:SCAN:DATA? <count>`` response for the given channels."""
+    times = _timestamps(count, end or datetime.now(), interval)
+    ticks = {
+        "$type": _TICKS,
+        "$values": [
+            {
+                "$type": f"{_CHANNELS}.DI.TimeTick, {_CHANNELS}",
+                "TickTime": t.strftime("%Y-%m-%d %H:%M:%S ") + f"{t.microsecond // 1000:03d}",
+            }
+            for t in times
+        ],
+    }
+    readings = []
+    for channel in channels:
+        samples = [_sample(channel, i) for i in range(count)]
+        nominal = _REFERENCE if _is_reference(channel) else _THERMOCOUPLE
+        reading = {
+            "TempValues": {"$type": _DOUBLES, "$values": [s[2] for s in samples]},
+            "TempUnit": nominal["TempUnit"],
+            "ChannelName": channel,
+            "Values": {"$type": _DOUBLES, "$values": [s[0] for s in samples]},
+            "ValuesFiltered": {"$type": _DOUBLES, "$values": [s[1] for s in samples]},
+            "DateTimeTicks": ticks,
+            "Unit": nominal["Unit"],
+            "ValueDecimals": 6,
+        }
+        if _is_reference(channel):
+            name = "DITemperatureReading"
+            reading["TempDecimals"] = 4
+        else:
+            name = "DITCReading"
+            reading.update({
+                "TempDecimals": 3,
+                "CJCs": {"$type": _DOUBLES, "$values": [23.61] * count},
+                "CJCUnit": 1001,
+                "CjcRaws": {"$type": _DOUBLES, "$values": [0.0] * count},
+                "CJCRawsUnit": 32767,
+                "CJCDecimals": 2,
+                "NumElectrical": 1,
+            })
+        readings.append({
+            "$type": f"{_CHANNELS}.DI.{name}, {_CHANNELS}",
+            **reading,
+            "ClassName": name,
+        })
+    return json.dumps(
+        {"$type": _READINGS, "$values": readings}, separators=(",", ":")
+    )
+
+
+def scan_data_last(
+    channels: List[str], longformat: bool = True, now: Optional[datetime] = None
+) -> str:
+    """Build a ``SCAN:DATA:Last? <1|2>`` response for the given channels."""
+    [time] = _timestamps(1, now or datetime.now(), 1.0)
+    tick = TimeTick(time.strftime("%Y-%m-%d %H:%M:%S %f"))
+    stamp = tick.to_ticks() if longformat else tick.to_short_format()
+    parts = []
+    for channel in channels:
+        nominal = _REFERENCE if _is_reference(channel) else _THERMOCOUPLE
+        value, filtered, temp = _sample(channel, 0)
+        row = (
+            f"{channel},{nominal['Unit']},1,{stamp},{value:.6f},{filtered:.6f},"
+            f"{nominal['TempUnit']},1,"
+        )
+        if _is_reference(channel):
+            row += f"{temp:.4f}"
+        else:
+            row += f"{temp:.3f},32767,0,1001,1,23.61"
+        parts.append(row + ";")
+    return '"' + "".join(parts) + '"'
+
+
+# Pattern-matched handlers, tried in order for queries missing from the response
+# table. Each takes the regex match and the simulated device, which provides
+# ``responses`` (the recorded table) and ``channels`` (the scanned channels).
+HANDLERS: List[Tuple[Pattern, Callable[[Match, Any], Optional[str]]]] = []
+
+
+def handler(pattern: str):
+    """Register a response handler for commands matching `pattern`."""
+    def register(func):
+        HANDLERS.append((re.compile(pattern, re.IGNORECASE), func))
+        return func
+    return register
+
+
+def respond(command: str, device) -> Optional[str]:
+    """Return the synthesized response to `command`, or None if nothing matches."""
+    for pattern, func in HANDLERS:
+        if match := pattern.match(command):
+            if (response := func(match, device)) is not None:
+                return response
+    return None
+
+
+@handler(r"^JSON:(?:MEASure:)?SCAN:DATA\?\s+(\d+)$")
+def _scan_data(match: Match, device) -> str:
+    return scan_data_json(device.channels, int(match.group(1)))
+
+
+@handler(r"^SCAN:DATA:Last\?\s+([12])$")
+def _scan_data_last(match: Match, device) -> str:
+    return scan_data_last(device.channels, longformat=match.group(1) == "2")
+
+
+@handler(r'^((?:MEASure:)?CHANnel:CONFig:JSON\?)\s+"([^"]*)"$')
+def _channel_configs(match: Match, device) -> Optional[str]:
+    # Assemble a config list for any subset of channels from the recorded
+    # single-channel responses.
+    command, names = match.groups()
+    configs, list_type = [], None
+    for name in names.split(","):
+        if (response := device.responses.get(f'{command} "{name}"')) is None:
+            return None
+        document = json.loads(response)
+        list_type = document["$type"]
+        configs.extend(document["$values"])
+    return json.dumps({"$type": list_type, "$values": configs}, separators=(",", ":"))
+
+
+_CHANNEL_NAME = re.compile(r"""['"]ChannelName['"]\s*:\s*['"]([^'"]*)['"]""")
+
+
+def default_channels(responses: dict) -> List[str]:
+    """Return the channels of the scan recorded in the response table."""
+    _, _, channels = responses.get("SCAN:STARt?", "").partition(",")
+    return channels.split(",") if channels else ["REF1"]
+
+
+def scan_channels(command: str) -> List[str]:
+    """Return the channels named by a scan start command."""
+    if match := _CHANNEL_NAME.search(command):
+        return match.group(1).split(",")
+    _, _, arguments = command.strip().partition(" ")
+    _, _, channels = arguments.strip('"').partition(",")
+    return [c for c in channels.strip('"').split(",") if c]
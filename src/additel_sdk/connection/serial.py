@@ -1,11 +1,19 @@
 import serial
+from time import monotonic
 from . import Connection
+from .framing import ResponseFramer
 
 
 class SerialConnection(Connection):
-    """Class to handle Serial connection to the device."""
+    """Class to handle Serial connection to the device.
+
+    Responses are drained in bulk using ``in_waiting`` and split at the line
+    terminator by a :class:`ResponseFramer`, which keeps any bytes that follow a
+    response for the next read. `timeout` is an overall deadline per response.
+    """
 
     type = "serial"
+    pipelining = True
 
     def __init__(self, parent, **kwargs):
         self.port = kwargs.get("port")
@@ -15,12 +23,14 @@ class SerialConnection(Connection):
         self.stopbits = kwargs.get("stopbits", serial.STOPBITS_ONE)
         self.timeout = kwargs.get("timeout", 1)
         self.serial_port = None
+        self._framer = ResponseFramer()
 
         if not self.port:
             raise ValueError("Serial port must be specified.")
 
     def __enter__(self):
         """Establish a serial connection to the device."""
+        self._framer.clear()
         try:
             self.serial_port = serial.Serial(
                 port=self.port,
@@ -33,8 +43,9 @@ class SerialConnection(Connection):
         except serial.SerialException as e:
             msg = f"Failed to open serial port {self.port} - {e}"
             raise ConnectionError(msg) from e
+        return self
 
-    def __exit__(self):
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None):
         """Close the serial connection."""
         if self.serial_port and self.serial_port.is_open:
             try:
@@ -54,13 +65,38 @@ class SerialConnection(Connection):
         except serial.SerialException as e:
             raise IOError(f"Failed to send command '{command}' - {e}") from e
 
+    def send_many(self, commands):
+        """Write several commands back to back in a single write."""
+        if not self.serial_port or not self.serial_port.is_open:
+            raise ConnectionError("Serial connection is not established.")
+
+        try:
+            self.serial_port.write("".join(f"{c}\r\n" for c in commands).encode())
+        except serial.SerialException as e:
+            raise IOError(f"Failed to send {len(commands)} commands - {e}") from e
+
     def read_response(self):
         """Read a response from the device over the serial connection."""
         if not self.serial_port or not self.serial_port.is_open:
             raise ConnectionError("Serial connection is not established.")
 
+        deadline = monotonic() + self.timeout
         try:
-            response = self.serial_port.read(1024).decode().strip()
-            return response
+            # Changing the port timeout reconfigures the port, so it is only
+            # ever set here; one blocking read then ends by the deadline.
+            if self.serial_port.timeout != self.timeout:
+                self.serial_port.timeout = self.timeout
+            while (frame := self._framer.pop()) is None:
+                if waiting := self.serial_port.in_waiting:
+                    self._framer.feed(self.serial_port.read(waiting))
+                    continue
+                if monotonic() >= deadline:
+                    if (frame := self._framer.pop_partial()) is not None:
+                        break
+                    raise TimeoutError(
+                        "No response received within the timeout period."
+                    )
+                self._framer.feed(self.serial_port.read_until(self._framer.terminator))
         except serial.SerialException as e:
             raise IOError(f"Failed to read response - {e}") from e
+        return frame.decode()
@@ -0,0 +1,288 @@
+# connection/tcp.py - Shared transport for connections over a TCP socket.
+import codecs
+import logging
+import random
+import select
+import socket
+from time import monotonic, sleep
+from typing import Iterator, Optional
+from ..log import Truncated
+from ..scpi import is_query, is_scan_start, is_scan_stop
+from ..timeouts import TimeoutPolicy
+from .base import Connection
+from .framing import JSONValuesStreamer, ResponseFramer
+
+logger = logging.getLogger(__name__)
+
+
+class TCPConnection(Connection):
+    """Base class for connections that exchange SCPI lines over a TCP socket.
+
+    Received bytes are read with ``recv_into`` into one reusable buffer, split into
+    responses by a :class:`ResponseFramer` and decoded with an incremental decoder,
+    so a multibyte character (e.g. "℃" or "Ω") split across two reads is carried
+    over instead of dropped.
+
+    Keyword Args:
+        ip (str): Address of the device.
+        port (int): TCP port. Defaults to `default_port`.
+        timeout (float): Socket timeout in seconds.
+        timeout_policy (TimeoutPolicy): If given, the timeout for each query is
+            chosen by the policy from its header and expected response size, and
+            the policy learns from the observed response times. Otherwise
+            `timeout` applies to every command.
+        chunk_size (int): Maximum number of bytes read per ``recv_into``.
+        nodelay (bool): Set TCP_NODELAY so short queries are not held back by
+            Nagle's algorithm. Defaults to True.
+        keepalive (bool): Enable TCP keepalive probes. Defaults to True.
+        rcvbuf (int): Requested SO_RCVBUF size in bytes. Defaults to the OS value.
+        reconnect (bool): Opt in to automatic recovery from a broken link. The
+            socket is reopened with exponential backoff and full jitter, the last
+            scan start command is re-sent, and an in-flight query is replayed.
+            Commands that are not queries are never replayed. Defaults to False.
+        reconnect_attempts (int): Connection attempts per recovery.
+        reconnect_base_delay (float): Upper bound of the first backoff, in seconds.
+        reconnect_max_delay (float): Cap on the backoff, in seconds.
+    """
+
+    pipelining = True
+    default_port = None
+    default_timeout = 1
+    chunk_size = 16384
+    partial_timeout = 0.05  # Wait this long for the end of an unterminated reply
+    keepalive_idle = 10  # Seconds of idle time before the first keepalive probe
+    keepalive_interval = 5
+    keepalive_count = 3
+
+    def __init__(self, parent, **kwargs):
+        self.parent = parent
+        self.ip = kwargs.pop("ip", None)
+        self.port = kwargs.pop("port", self.default_port)
+        self.timeout = kwargs.pop("timeout", self.default_timeout)
+        self.timeout_policy: Optional[TimeoutPolicy] = kwargs.pop("timeout_policy", None)
+        self.encoding = kwargs.pop("encoding", "utf-8")
+        self.chunk_size = kwargs.pop("chunk_size", self.chunk_size)
+        self.nodelay = kwargs.pop("nodelay", True)
+        self.keepalive = kwargs.pop("keepalive", True)
+        self.rcvbuf = kwargs.pop("rcvbuf", None)
+        self.reconnect = kwargs.pop("reconnect", False)
+        self.reconnect_attempts = kwargs.pop("reconnect_attempts", 10)
+        self.reconnect_base_delay = kwargs.pop("reconnect_base_delay", 0.5)
+        self.reconnect_max_delay = kwargs.pop("reconnect_max_delay", 30)
+        self.socket = None
+        self._in_flight = None  # Query whose response has not been read yet
+        self._sent_at = None  # When the in-flight query was sent
+        self._scan_command = None  # Last command that started a scan
+        self._recv_buffer = bytearray(self.chunk_size)
+        self._framer = ResponseFramer()
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+
+    def __enter__(self):
+        """Establish a socket connection to the device."""
+        self.socket = None
+        self._framer.clear()
+        self._decoder.reset()
+        try:
+            self.socket = socket.create_connection(
+                (self.ip, self.port), timeout=self.timeout
+            )
+            self._configure_socket(self.socket)
+        except OSError as e:
+            logger.error("Error connecting to Additel device: %s", e)
+            raise ConnectionError(
+                f"Failed to connect to {self.ip}:{self.port} - {e}"
+            ) from e
+        return self
+
+    def _configure_socket(self, sock: socket.socket) -> None:
+        """Apply TCP_NODELAY, keepalive and receive-buffer options."""
+        if self.nodelay:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.keepalive:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Tune the probes where the platform exposes the options.
+            for name, value in (
+                ("TCP_KEEPIDLE", self.keepalive_idle),
+                ("TCP_KEEPINTVL", self.keepalive_interval),
+                ("TCP_KEEPCNT", self.keepalive_count),
+            ):
+                if hasattr(socket, name):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+        if self.rcvbuf:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None):
+        """Close the socket connection."""
+        if self.socket:
+            try:
+                self.socket.close()
+            except OSError as e:
+                raise ConnectionError(f"Failed to close connection - {e}") from e
+            finally:
+                self.socket = None
+
+    def send_command(self, command: str) -> None:
+        """Send a command to the device over the socket connection."""
+        self._in_flight = command if is_query(command) else None
+        try:
+            self._apply_timeout(command)
+            self._send(f"{command}\n")
+        except IOError as e:
+            if not self._is_link_failure(e.__cause__):
+                raise
+            self._recover(e)
+            if not self._in_flight:
+                raise
+            self._apply_timeout(command)
+            self._send(f"{command}\n")
+        self._sent_at = monotonic()
+        if is_scan_start(command):
+            self._scan_command = command
+        elif is_scan_stop(command):
+            self._scan_command = None
+
+    def send_many(self, commands) -> None:
+        """Write several commands back to back in a single send."""
+        self._in_flight = None
+        try:
+            self._apply_timeout(*commands)
+            self._send("".join(f"{command}\n" for command in commands))
+        except IOError as e:
+            if self._is_link_failure(e.__cause__):
+                self._recover(e)
+            raise
+
+    def _apply_timeout(self, *commands: str) -> None:
+        """Set the socket timeout the policy chooses for the queries about to be sent."""
+        if self.timeout_policy is None or self.socket is None:
+            return
+        timeouts = [self.timeout_policy.timeout(c) for c in commands if is_query(c)]
+        if timeouts:
+            self.socket.settimeout(max(timeouts))
+
+    def _send(self, data: str) -> None:
+        if not self.socket:
+            raise ConnectionError(f"{type(self).__name__} is not established.")
+        try:
+            self.socket.sendall(data.encode(self.encoding))
+        except OSError as e:
+            logger.error("Error sending %s: %s", Truncated(data.strip()), e)
+            raise IOError(f"Failed to send {data.strip()!r} - {e}") from e
+
+    def _is_link_failure(self, error: Optional[BaseException]) -> bool:
+        """Whether `error` means the socket is broken and recovery is enabled."""
+        return (
+            self.reconnect
+            and isinstance(error, OSError)
+            and not isinstance(error, TimeoutError)
+        )
+
+    def _recover(self, error: BaseException) -> None:
+        """Reopen the socket with backoff and restore the last scan."""
+        logger.warning("Connection to %s:%s lost (%s).", self.ip, self.port, error)
+        self.__exit__()
+        delay = self.reconnect_base_delay
+        for attempt in range(1, self.reconnect_attempts + 1):
+            sleep(random.uniform(0, delay))
+            try:
+                self.__enter__()
+                break
+            except ConnectionError as e:
+                logger.warning("Reconnect attempt %d failed: %s", attempt, e)
+                delay = min(delay * 2, self.reconnect_max_delay)
+        else:
+            raise ConnectionError(
+                f"Failed to reconnect to {self.ip}:{self.port} after "
+                f"{self.reconnect_attempts} attempts."
+            ) from error
+        logger.info("Reconnected to %s:%s after %d attempts.", self.ip, self.port, attempt)
+        if self._scan_command:
+            self._send(f"{self._scan_command}\n")
+
+    def read_response(self, chunk_size: Optional[int] = None) -> Optional[str]:
+        """Read the response from the connected device in chunks until complete."""
+        for _ in range(max(1, self.reconnect_attempts) if self.reconnect else 1):
+            try:
+                response = self._receive(chunk_size)
+                if response is not None or not self.reconnect:
+                    if response is not None and self._in_flight and self.timeout_policy:
+                        self.timeout_policy.observe(
+                            self._in_flight, monotonic() - self._sent_at
+                        )
+                    self._in_flight = None
+                    return response
+                error = ConnectionError("Connection closed by the device.")
+            except OSError as e:
+                if not self._is_link_failure(e):
+                    raise
+                error = e
+            command, self._in_flight = self._in_flight, None
+            self._recover(error)
+            if command is None:
+                raise ConnectionError("Connection lost while reading.") from error
+            logger.info("Replaying query: %s", command)
+            self._in_flight = command
+            self._apply_timeout(command)
+            self._send(f"{command}\n")
+            self._sent_at = monotonic()
+        raise ConnectionError("Connection lost while replaying query.") from error
+
+    def _receive(self, chunk_size: Optional[int] = None) -> Optional[str]:
+        view = self._recv_view(chunk_size or self.chunk_size)
+        parts = []
+        while (frame := self._framer.pop()) is None:
+            if self._framer.pending_text and not self._data_waiting(self.partial_timeout):
+                # The device has gone quiet, so accept an unterminated text reply,
+                # unless it ends part-way through a multibyte character.
+                if (partial := self._framer.pop_partial()) is not None:
+                    parts.append(self._decoder.decode(partial))
+                    if not self._decoder.getstate()[0]:
+                        break
+            if not (count := self.socket.recv_into(view)):
+                break
+            self._framer.feed(view[:count])
+        if frame is not None:
+            parts.append(self._decoder.decode(frame))
+        elif not parts:
+            return None
+        parts.append(self._decoder.decode(b"", final=True))
+        return "".join(parts)
+
+    def read_json_values(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """Yield each element of a JSON list response as soon as it has arrived.
+
+        Only the element being received is buffered. If the caller stops early,
+        the rest of the response is read and discarded so the next response
+        starts cleanly.
+        """
+        streamer = JSONValuesStreamer()
+        streamer.feed(self._framer.buffer)  # Bytes already received
+        self._framer.clear()
+        view = self._recv_view(chunk_size or self.chunk_size)
+        try:
+            while True:
+                yield from streamer
+                if streamer.done:
+                    break
+                self._receive_into(streamer, view)
+        except GeneratorExit:
+            while not streamer.done:
+                if streamer.pop() is None and not streamer.done:
+                    self._receive_into(streamer, view)
+            raise
+        finally:
+            self._framer.feed(streamer.leftover)
+            self._in_flight = None
+
+    def _receive_into(self, streamer: JSONValuesStreamer, view: memoryview) -> None:
+        if not (count := self.socket.recv_into(view)):
+            raise ConnectionError("Connection closed by the device.")
+        streamer.feed(view[:count])
+
+    def _recv_view(self, size: int) -> memoryview:
+        if len(self._recv_buffer) < size:
+            self._recv_buffer = bytearray(size)
+        return memoryview(self._recv_buffer)[:size]
+
+    def _data_waiting(self, timeout: float = 0) -> bool:
+        return bool(select.select([self.socket], [], [], timeout)[0])
@@ -1,14 +1,27 @@
+import array
 import usb.core
 import usb.util
 from usb.backend import libusb1
 import logging
+from time import monotonic
 from . import Connection
+from .framing import ResponseFramer
+
+logger = logging.getLogger(__name__)
 
 
 class USBConnection(Connection):
-    """Class to handle USB connection to the device."""
+    """Class to handle USB connection to the device.
+
+    Responses are read with bulk-IN transfers into a preallocated buffer of
+    `packets_per_transfer` packets. A transfer that ends with a short packet marks
+    the end of the device's message; otherwise reading continues until the
+    framer sees the terminator or a complete JSON document.
+    """
 
     type = "usb"
+    pipelining = True
+    packets_per_transfer = 64
 
     def __init__(self, parent, **kwargs):
         self.vendor_id = kwargs.get("vendor_id")
@@ -17,6 +30,9 @@ class USBConnection(Connection):
         self.device = None
         self.endpoint_out = None
         self.endpoint_in = None
+        self.timeout = kwargs.get("timeout", 5000)  # Milliseconds
+        self._buffer = None
+        self._framer = ResponseFramer()
 
         if not self.vendor_id or not self.product_id:
             raise ValueError(
@@ -63,14 +79,19 @@ class USBConnection(Connection):
         except usb.core.USBError as e:
             raise ConnectionError(f"Failed to establish USB connection: {e}") from e
 
-    def __exit__(self):
+        size = self.endpoint_in.wMaxPacketSize * self.packets_per_transfer
+        self._buffer = array.array("B", bytes(size))
+        self._framer.clear()
+        return self
+
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None):
         """Release the USB device."""
         try:
             if self.device:
                 usb.util.dispose_resources(self.device)
                 self.device = None
         except usb.core.USBError as e:
-            logging.error(f"Failed to release USB device: {e}")
+            logger.error("Failed to release USB device: %s", e)
             raise ConnectionError(f"Failed to disconnect USB device: {e}") from e
 
     def send_command(self, command):
@@ -81,26 +102,50 @@ class USBConnection(Connection):
             )
 
         try:
-            self.endpoint_out.write(command)
+            self.endpoint_out.write(f"{command}\n".encode("utf-8"))
         except usb.core.USBError as e:
             raise IOError(f"Failed to send command '{command}': {e}") from e
 
-    def read_response(self, timeout=5000):
-        """Read response from the USB device."""
+    def send_many(self, commands):
+        """Write several commands back to back in a single bulk-OUT transfer."""
+        self.send_command("\n".join(commands))
+
+    def read_response(self, timeout=None):
+        """Read response from the USB device.
+
+        Args:
+            timeout (int, optional): Overall deadline in milliseconds. Defaults to
+                the connection's `timeout`.
+        """
         if not self.device or not self.endpoint_in:
             raise ConnectionError(
                 "USB device is not connected or input endpoint is unavailable."
             )
 
+        timeout = self.timeout if timeout is None else timeout
+        deadline = monotonic() + timeout / 1000
+        buffer = self._buffer
         try:
-            response = self.device.read(
-                self.endpoint_in.bEndpointAddress,
-                self.endpoint_in.wMaxPacketSize,
-                timeout=timeout,
-            )
-            return response.tobytes().decode("utf-8").strip()
+            while (frame := self._framer.pop()) is None:
+                remaining = round((deadline - monotonic()) * 1000)
+                if remaining <= 0:
+                    raise TimeoutError("No response received within the timeout.")
+                count = self.device.read(
+                    self.endpoint_in.bEndpointAddress, buffer, timeout=remaining
+                )
+                self._framer.feed(memoryview(buffer)[:count])
+                if count < len(buffer):
+                    # A short packet ends the device's message.
+                    if (frame := self._framer.pop()) is None:
+                        frame = self._framer.pop_partial()
+                    if frame is not None:
+                        break
+        except usb.core.USBTimeoutError as e:
+            if (frame := self._framer.pop_partial()) is None:
+                raise TimeoutError(f"No response received within the timeout: {e}") from e
         except usb.core.USBError as e:
             raise IOError(f"Failed to read response: {e}") from e
+        return frame.decode("utf-8")
 
     def list_available_devices():
         """Utility method to list all connected USB devices."""
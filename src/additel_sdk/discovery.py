@@ -0,0 +1,96 @@
+# discovery.py - Find Additel devices on a subnet.
+import asyncio
+import ipaddress
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from .aio.connection import AsyncTCPConnection
+
+logger = logging.getLogger(__name__)
+
+# Port probed for each transport that speaks the SCPI line protocol over TCP.
+DEFAULT_PORTS = {
+    cls.default_port: connection_type
+    for connection_type, cls in AsyncTCPConnection.registry.items()
+}
+
+
+@dataclass
+class DiscoveredDevice:
+    """A device that answered *IDN? during discovery."""
+
+    ip: str
+    port: int
+    connection_type: str  # Pass to Additel(connection_type, ip=..., port=...)
+    serial_number: str
+    software_version: str
+
+
+async def _probe(
+    ip: str, port: int, connection_type: str, timeout: float
+) -> Optional[DiscoveredDevice]:
+    connection = AsyncTCPConnection.create(
+        connection_type, ip=ip, port=port, timeout=timeout
+    )
+    try:
+        async with connection:
+            response = await connection.cmd("*IDN?")
+    except (OSError, asyncio.TimeoutError):
+        return None
+    if not response or "," not in response:
+        return None
+    psn, svn = response.split(",", 1)
+    return DiscoveredDevice(ip, port, connection_type, psn.strip("'\""), svn.strip())
+
+
+async def discover_async(
+    network: str,
+    ports: Optional[Dict[int, str]] = None,
+    timeout: float = 1.0,
+    concurrency: int = 512,
+) -> List[DiscoveredDevice]:
+    """Probe every host of `network` concurrently and return the responders.
+
+    Args:
+        network (str): CIDR range to scan, e.g. "192.168.1.0/24".
+        ports (Dict[int, str], optional): Port to probe mapped to the connection
+            type that serves it. Defaults to 8000 (wlan) and 5025 (ethernet).
+        timeout (float): Connect and response timeout per probe, in seconds.
+        concurrency (int): Maximum number of probes in flight at once.
+
+    Returns:
+        List[DiscoveredDevice]: Responders, ordered by address and port.
+    """
+    ports = ports or DEFAULT_PORTS
+    hosts = [str(host) for host in ipaddress.ip_network(network, strict=False).hosts()]
+    limit = asyncio.Semaphore(concurrency)
+
+    async def probe(ip, port, connection_type):
+        async with limit:
+            return await _probe(ip, port, connection_type, timeout)
+
+    results = await asyncio.gather(*(
+        probe(ip, port, connection_type)
+        for ip in hosts
+        for port, connection_type in ports.items()
+    ))
+    devices = [device for device in results if device]
+    logger.info("Discovered %d device(s) on %s.", len(devices), network)
+    return devices
+
+
+def discover(
+    network: str,
+    ports: Optional[Dict[int, str]] = None,
+    timeout: float = 1.0,
+    concurrency: int = 512,
+) -> List[DiscoveredDevice]:
+    """Blocking wrapper around :func:`discover_async`.
+
+    Scanning a /24 takes about one `timeout`, since all hosts are probed at once.
+
+    Example:
+        >>> for found in discover("192.168.1.0/24"):
+        ...     device = Additel(found.connection_type, ip=found.ip, port=found.port)
+    """
+    return asyncio.run(discover_async(network, ports, timeout, concurrency))
@@ -3,6 +3,8 @@ import os
 import csv
 import docs.appendices as appendices
 
+logger = logging.getLogger(__name__)
+
 
 class AdditelError(Exception):
     _error_lookup = None
@@ -22,7 +24,7 @@ class AdditelError(Exception):
         self.error_explanation = err_explain
 
         message = f"[{error_code}] {error_message} — {err_desc}: {err_explain}"
-        logging.error(f"Error reading response: {message}")
+        logger.error("Error reading response: %s", message)
         super().__init__(message)
 
     @staticmethod
@@ -0,0 +1,95 @@
+# journal.py - Bounded record of the commands sent to a device.
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+from typing import Deque, Iterator, List, Optional
+from .scpi import is_query
+
+
+@dataclass
+class CommandRecord:
+    """One command sent to the device, and what came of it.
+
+    Times are from ``time.monotonic``, in seconds.
+    """
+
+    command: str
+    sent_at: float
+    bytes_sent: int
+    received_at: Optional[float] = None
+    bytes_received: int = 0
+    outcome: str = "pending"  # pending, sent, queued, ok, empty, timeout, error
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Seconds between sending the command and receiving its response."""
+        if self.received_at is None:
+            return None
+        return self.received_at - self.sent_at
+
+
+class CommandJournal:
+    """Fixed-capacity ring buffer of :class:`CommandRecord`.
+
+    Once `capacity` records are held, each new record evicts the oldest, so
+    memory stays flat however long the device is driven. A response completes
+    the record of the query it answers, or else the oldest query still pending.
+
+    Args:
+        capacity (int): Maximum number of records kept.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        self.capacity = capacity
+        self._records: Deque[CommandRecord] = deque(maxlen=capacity)
+        self._pending: Deque[CommandRecord] = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[CommandRecord]:
+        return iter(self._records)
+
+    def __getitem__(self, index: int) -> CommandRecord:
+        return self._records[index]
+
+    def sent(self, command: str, queued: bool = False) -> CommandRecord:
+        """Record a command written to (or queued for) the device."""
+        record = CommandRecord(command, monotonic(), len(command.encode()) + 1)
+        if queued:
+            record.outcome = "queued"
+        elif is_query(command):
+            self._pending.append(record)
+        else:
+            record.outcome = "sent"
+        self._records.append(record)
+        return record
+
+    def received(
+        self,
+        response: Optional[str],
+        outcome: Optional[str] = None,
+        record: Optional[CommandRecord] = None,
+    ) -> Optional[CommandRecord]:
+        """Complete `record`, or the oldest query still waiting for its response."""
+        if record is None:
+            if not self._pending:
+                return None
+            record = self._pending.popleft()
+        else:
+            # By identity: records of repeated commands compare equal
+            for index, pending in enumerate(self._pending):
+                if pending is record:
+                    del self._pending[index]
+                    break
+        record.received_at = monotonic()
+        if response is not None:
+            record.bytes_received = len(response.encode()) + 1
+        record.outcome = outcome or ("ok" if response is not None else "empty")
+        return record
+
+    def commands(self) -> List[str]:
+        """Return the recorded commands, oldest first."""
+        return [record.command for record in self._records]
@@ -0,0 +1,97 @@
+# log.py - Logging helpers for the SDK.
+"""The SDK logs through module loggers under the package logger and never
+configures logging itself. Applications either configure logging as usual or
+call :func:`configure_logging` to write the SDK's records to a file from a
+background thread.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+PACKAGE_LOGGER = __name__.rpartition(".")[0]
+MAX_PAYLOAD = 200  # Characters of a command or response kept in a log record
+
+DEFAULT_FORMAT = "%(asctime)s [%(levelname)s] (%(connection_type)s) %(message)s"
+
+
+class ConnectionTypeFilter(logging.Filter):
+    """Give records a `connection_type` attribute for the log format.
+
+    Records logged by an :class:`Additel` handle already carry the type of its
+    connection; any other record gets `conn_type`.
+    """
+
+    def __init__(self, conn_type="-"):
+        super().__init__()
+        self.conn_type = conn_type
+
+    def filter(self, record):
+        if not hasattr(record, "connection_type"):
+            record.connection_type = self.conn_type
+        return True
+
+
+class Truncated:
+    """Defer shortening a payload until a record is actually formatted.
+
+    Example:
+        >>> logger.info("Response: %s", Truncated(response))
+    """
+
+    __slots__ = ("text", "limit")
+
+    def __init__(self, text, limit: int = MAX_PAYLOAD):
+        self.text = text
+        self.limit = limit
+
+    def __str__(self):
+        text = str(self.text)
+        if len(text) <= self.limit:
+            return text
+        return f"{text[:self.limit]}... ({len(text)} characters)"
+
+
+def configure_logging(
+    filename: str = "additel.log",
+    level: int = logging.DEBUG,
+    fmt: str = DEFAULT_FORMAT,
+    handler: Optional[logging.Handler] = None,
+) -> QueueListener:
+    """Send the SDK's log records to a file through a background thread.
+
+    The SDK's loggers only put records on a queue; a :class:`QueueListener`
+    formats and writes them, so slow disk I/O stays off the command path.
+
+    Args:
+        filename (str): File to write to, unless `handler` is given.
+        level (int): Lowest level logged by the SDK.
+        fmt (str): Log format; may use ``%(connection_type)s``.
+        handler (logging.Handler): Handler to write with instead of a file.
+
+    Returns:
+        QueueListener: The running listener. It is stopped at exit if the
+        application has not stopped it already.
+    """
+    if handler is None:
+        handler = logging.FileHandler(filename)
+    handler.setFormatter(logging.Formatter(fmt))
+    records = queue.SimpleQueue()
+    queue_handler = QueueHandler(records)
+    queue_handler.addFilter(ConnectionTypeFilter())
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    logger.addHandler(queue_handler)
+    logger.setLevel(level)
+    listener = QueueListener(records, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(_stop, listener)
+    return listener
+
+
+def _stop(listener: QueueListener) -> None:
+    try:
+        listener.stop()
+    except AttributeError:
+        pass  # Already stopped by the application
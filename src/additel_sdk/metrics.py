@@ -0,0 +1,159 @@
+# metrics.py - Per-command latency, size and parse-time histograms.
+import math
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+
+class Histogram:
+    """Histogram with logarithmic buckets, in the style of HdrHistogram.
+
+    Each power of two is split into `precision` buckets, so the relative error
+    of a recorded value is bounded (about 19% for the default of 4) whatever
+    its magnitude. Recording is O(1) and memory grows only with the range of
+    values seen.
+
+    Args:
+        precision (int): Buckets per power of two.
+    """
+
+    def __init__(self, precision: int = 4):
+        self.precision = precision
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.zeros = 0
+        self._buckets: Dict[int, int] = defaultdict(int)
+
+    def record(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if value <= 0:
+            self.zeros += 1
+        else:
+            self._buckets[math.floor(math.log2(value) * self.precision)] += 1
+
+    def upper_bound(self, index: int) -> float:
+        """Return the largest value counted in bucket `index`."""
+        return 2 ** ((index + 1) / self.precision)
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Return (upper bound, cumulative count) pairs, smallest first."""
+        total = self.zeros
+        result = [(0.0, total)] if total else []
+        for index in sorted(self._buckets):
+            total += self._buckets[index]
+            result.append((self.upper_bound(index), total))
+        return result
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return an upper bound of the `q` quantile (0-1) of the recorded values."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        for bound, total in self.buckets():
+            if total >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+        }
+
+
+class Metrics:
+    """Per-command-header histograms of round-trip latency, bytes and parse time.
+
+    Latency is measured from sending a query to reading its response; parse time
+    covers turning the response into Python objects. Comparing the two shows
+    whether time goes to the network and device or to the parsers. Failed
+    queries are counted by outcome (e.g. timeout, error).
+
+    Example:
+        >>> device.Scan.get_data_json(100)
+        >>> device.metrics.snapshot()["JSON:SCAN:DATA?"]["latency"]["p99"]
+        >>> print(device.metrics.to_prometheus())
+    """
+
+    histograms = ("latency", "parse", "bytes_sent", "bytes_received")
+
+    def __init__(self, precision: int = 4):
+        self.precision = precision
+        self._lock = threading.Lock()
+        self._commands: Dict[str, Dict[str, Histogram]] = {}
+        self._errors: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    def _histograms(self, command_header: str) -> Dict[str, Histogram]:
+        if command_header not in self._commands:
+            self._commands[command_header] = {
+                name: Histogram(self.precision) for name in self.histograms
+            }
+        return self._commands[command_header]
+
+    def observe(self, command_header: str, **values: float) -> None:
+        """Record values for a header, e.g. ``observe("*IDN?", latency=0.01)``."""
+        with self._lock:
+            histograms = self._histograms(command_header)
+            for name, value in values.items():
+                histograms[name].record(value)
+
+    def count_error(self, command_header: str, outcome: str) -> None:
+        with self._lock:
+            self._errors[(command_header, outcome)] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._commands.clear()
+            self._errors.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Return the metrics of every header as plain dictionaries."""
+        with self._lock:
+            result = {
+                header: {name: h.snapshot() for name, h in histograms.items()}
+                for header, histograms in self._commands.items()
+            }
+            for (header, outcome), count in self._errors.items():
+                result.setdefault(header, {}).setdefault("errors", {})[outcome] = count
+        return result
+
+    def to_prometheus(self, prefix: str = "additel") -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        units = {"latency": "seconds", "parse": "seconds",
+                 "bytes_sent": "bytes", "bytes_received": "bytes"}
+        lines = []
+        with self._lock:
+            for name in self.histograms:
+                metric = f"{prefix}_command_{name}_{units[name]}"
+                lines.append(f"# TYPE {metric} histogram")
+                for header, histograms in sorted(self._commands.items()):
+                    histogram = histograms[name]
+                    if not histogram.count:
+                        continue
+                    label = f'command="{_escape(header)}"'
+                    for bound, total in histogram.buckets():
+                        lines.append(f'{metric}_bucket{{{label},le="{bound:.6g}"}} {total}')
+                    lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {histogram.count}')
+                    lines.append(f"{metric}_sum{{{label}}} {histogram.sum:.9g}")
+                    lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+            metric = f"{prefix}_command_errors_total"
+            lines.append(f"# TYPE {metric} counter")
+            for (header, outcome), count in sorted(self._errors.items()):
+                lines.append(
+                    f'{metric}{{command="{_escape(header)}",outcome="{outcome}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -16,6 +16,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.additel_sdk import Additel
 
+logger = logging.getLogger(__name__)
+
 
 @register_type("TAU.Module.Channels.DI.DIModuleInfo")
 @dataclass
@@ -49,7 +51,7 @@ class DIModuleInfo:
     @classmethod
     def from_str(cls, string: str) -> List["DIModuleInfo"]:
         # FIXME:  These mappings are not confirmed.
-        logging.warning("The mappings for DIModuleInfo.from_str are not confirmed.")
+        logger.warning("The mappings for DIModuleInfo.from_str are not confirmed.")
         modules = []
         for mod in string.split(";"):
             if not mod:
@@ -156,7 +158,7 @@ class Module:
         if module_index not in range(5):
             raise ValueError("Module index must be between 0 and 4 inclusive.")
         if response := self.parent.cmd(f"MODule:CONFig? {module_index}"):
-            return DIFunctionChannelConfig.from_str(response)
+            return self.parent.parse(DIFunctionChannelConfig.from_str, response)
 
     # 1.2.5
     def getConfiguration_json(self, module_index: int) -> List[DIFunctionChannelConfig]:
@@ -183,7 +185,7 @@ class Module:
                 "Use the getConfiguration method instead."
             )
         if response := self.parent.cmd(f"JSON:MODule:CONFig? {module_index}"):
-            return coerce(response)
+            return self.parent.parse(coerce, response)
         raise ValueError("No channel configuration received")
 
     def configure(
@@ -2,21 +2,46 @@
 
 from .channel import Channel
 from .coerce import coerce
+from .columnar import DIReadingBatch
 from .registry import register_type
 from .TimeTick import TimeTick
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from time import sleep
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Iterator, Optional, List, Tuple
 
 if TYPE_CHECKING:
     from src.additel_sdk import Additel
 
 
 def count_decimals_str(value: str) -> int:
-    if '.' in value:
-        return len(value.split('.')[1].rstrip('\n').rstrip())
-    return 0
+    dot = value.find('.')
+    if dot < 0:
+        return 0
+    return len(value.rstrip()) - dot - 1
+
+
+def parse_float(value: str) -> float:
+    """Parse a value of a text response; the device sends ``------`` for -inf."""
+    return float("-inf") if value == "------" else float(value)
+
+
+def split_readings(input: str) -> Iterator[Tuple[type, List[str]]]:
+    """Split a ``SCAN:DATA:Last?`` response into (reading class, fields) per channel.
+
+    The response is split once; the reading class is chosen by the number of
+    fields of each channel.
+    """
+    for reading in input[1:-2].split(";"):
+        fields = reading.split(",")
+        if fields[2] == "0":
+            raise ValueError("No data available for this channel.")
+        try:
+            yield READING_FORMATS[len(fields)], fields
+        except KeyError:
+            raise ValueError(
+                f"Unrecognized DIReading format with {len(fields)} fields."
+                ) from None
 
 
 def fmt(val, dec):
@@ -51,22 +76,18 @@ class DIReading:
     @classmethod
     def from_str(cls, input: str) -> List["DIReading"]:
         readings = []
-
-        for reading in input[1:-2].replace("------", "-inf").split(";"):
-            array = reading.split(",")
-            if array[2] == "0":
-                raise ValueError("No data available for this channel.")
-            elif len(array) == 9:
-                readings.append(DITemperatureReading.from_str(f'"{reading};"'))
-            elif len(array) == 14:
-                readings.append(DITCReading.from_str(f'"{reading};"'))
-            else:
-                raise ValueError(
-                    f"Unrecognized DIReading format with {len(array)} fields."
-                    )
-
+        ticks = {}  # The channels of a response usually share one time stamp
+        for reading_type, fields in split_readings(input):
+            if (tick := ticks.get(fields[3])) is None:
+                tick = ticks[fields[3]] = TimeTick(fields[3])
+            readings.append(reading_type.from_fields(fields, tick))
         return readings
 
+    @classmethod
+    def from_fields(cls, fields: List[str], tick: TimeTick) -> "DIReading":
+        """Build the reading of one ``SCAN:DATA:Last?`` row from its fields."""
+        return cls(DateTimeTicks=[tick], **cls.arguments(fields))
+
 
 @register_type("TAU.Module.Channels.DI.DIElectricalReading")
 @dataclass
@@ -94,22 +115,28 @@ class DITCReading(DIReading):
     @classmethod
     def from_str(cls, row: str) -> "DITCReading":
         fields = row[1:-2].split(",")
-        return cls(
-            ChannelName=fields[0],
-            Unit=int(fields[1]),
-            Values=[float(fields[4])],
-            ValuesFiltered=[float(fields[5])],
-            DateTimeTicks=[TimeTick(fields[3])],
-            TempUnit=int(fields[6]),
-            TempValues=[float(fields[8])],
-            CJCRawsUnit=int(fields[9]),
-            CJCUnit=int(fields[11]),
-            NumElectrical=int(fields[12]),
-            CJCs=[float(fields[13])],
-            CJCDecimals=count_decimals_str(fields[13]),
-            ValueDecimals=6,
-            TempDecimals=3,
-        )
+        return cls.from_fields(fields, TimeTick(fields[3]))
+
+    @staticmethod
+    def arguments(fields: List[str]) -> dict:
+        """Every field except DateTimeTicks, from the fields of a row."""
+        return {
+            "ChannelName": fields[0],
+            "Unit": int(fields[1]),
+            "ValuesCount": 1,
+            "Values": [parse_float(fields[4])],
+            "ValuesFiltered": [parse_float(fields[5])],
+            "ValueDecimals": 6,
+            "TempUnit": int(fields[6]),
+            "TempValues": [parse_float(fields[8])],
+            "TempDecimals": 3,
+            "CJCRawsUnit": int(fields[9]),
+            "CjcRaws": [],
+            "CJCUnit": int(fields[11]),
+            "NumElectrical": 1,  # len(TempValues), as in __post_init__
+            "CJCs": [parse_float(fields[13])],
+            "CJCDecimals": count_decimals_str(fields[13]),
+        }
 
     def __str__(self):
         parts = []
@@ -157,19 +184,23 @@ class DITemperatureReading(DIReading):
     @classmethod
     def from_str(cls, row: str) -> "DITemperatureReading":
         fields = row[1:-2].split(",")
-        return cls(
-            ChannelName=fields[0],
-            Unit=int(fields[1]),
-            ValuesCount=int(fields[2]),
-            DateTimeTicks=[TimeTick(fields[3])],
-            Values=[float(fields[4])],
-            ValueDecimals=count_decimals_str(fields[4]),
-            ValuesFiltered=[float(fields[5])],
-            TempUnit=int(fields[6]),
-            TempValuesCount=int(fields[7]),
-            TempValues=[float(fields[8])],
-            TempDecimals=count_decimals_str(fields[8]),
-        )
+        return cls.from_fields(fields, TimeTick(fields[3]))
+
+    @staticmethod
+    def arguments(fields: List[str]) -> dict:
+        """Every field except DateTimeTicks, from the fields of a row."""
+        return {
+            "ChannelName": fields[0],
+            "Unit": int(fields[1]),
+            "ValuesCount": 1,  # len(Values), as in __post_init__
+            "Values": [parse_float(fields[4])],
+            "ValueDecimals": count_decimals_str(fields[4]),
+            "ValuesFiltered": [parse_float(fields[5])],
+            "TempUnit": int(fields[6]),
+            "TempValuesCount": 1,
+            "TempValues": [parse_float(fields[8])],
+            "TempDecimals": count_decimals_str(fields[8]),
+        }
 
     def __str__(self):
         parts = []
@@ -185,6 +216,10 @@ class DITemperatureReading(DIReading):
         return '"' + "".join(parts) + '"'
 
 
+# Reading class of a SCAN:DATA:Last? row, by number of fields.
+READING_FORMATS = {9: DITemperatureReading, 14: DITCReading}
+
+
 @register_type("TAU.Module.Channels.DI.DIScanInfo")
 @dataclass
 class DIScanInfo:
@@ -244,7 +279,7 @@ class Scan:
         """
         meas = "MEASure:" if measure else ""
         if response := self.parent.cmd(meas + "JSON:SCAN:STARt?"):
-            return coerce(response)
+            return self.parent.parse(coerce, response)
 
     def get_configuration(self) -> DIScanInfo:
         """Acquire the scanning configuration.
@@ -268,7 +303,7 @@ class Scan:
         meas = "MEASure:" if measure else ""
         self.parent.send_command(f"{meas}SCAN:STOP")
 
-    def get_latest_data(self, longformat=True) -> DIReading:
+    def get_latest_data(self, longformat=True, columnar=False) -> DIReading:
         """Retrieves the latest scanning data for all active channels.
 
         Args:
@@ -276,12 +311,16 @@ class Scan:
                 If True, uses long timestamp format (ticks since 1/1/0001)
                 If False, uses "yyyy:MM:dd HH:mm:ss fff" format.
                 Defaults to False.
+            columnar (bool, optional): Return a DIReadingBatch instead of a
+                list of DIReading objects. Requires NumPy.
 
         Returns:
             DIReading: An object containing the latest scanning data.
         """
         response = self.parent.cmd(f"SCAN:DATA:Last? {2 if longformat else 1}")
-        instance = DIReading.from_str(response)
+        if columnar:
+            return self.parent.parse(DIReadingBatch.from_str, response)
+        instance = self.parent.parse(DIReading.from_str, response)
         # assert str(instance) == response, "Unexpected response"
         return instance
 
@@ -299,7 +338,40 @@ class Scan:
         """
         assert count > 0, "Count must be greater than 0."
         if response := self.parent.cmd(f"JSON:SCAN:DATA? {count}"):
-            return coerce(response)
+            return self.parent.parse(coerce, response)
+
+    def get_data_batch(self, count: int = 1) -> DIReadingBatch:
+        """Acquire scanning data in columnar form.
+
+        Same data as :meth:`get_data_json`, decoded straight into NumPy arrays
+        without building a DIReading per channel. Requires NumPy.
+
+        Args:
+            count (int): The number of scanning data points to retrieve, per channel.
+
+        Returns:
+            DIReadingBatch: The scanning data of all channels.
+        """
+        assert count > 0, "Count must be greater than 0."
+        if response := self.parent.cmd(f"JSON:SCAN:DATA? {count}"):
+            return self.parent.parse(DIReadingBatch.from_json, response)
+
+    def stream_data_json(self, count: int = 1) -> Iterator[DIReading]:
+        """Acquire scanning data in JSON format, one channel at a time.
+
+        Same data as :meth:`get_data_json`, but each channel's reading is
+        yielded as soon as it has been received and decoded, so a large `count`
+        never needs the whole response in memory. The device stays locked until
+        the generator is exhausted or closed (see :meth:`Additel.stream_json`).
+
+        Args:
+            count (int): The number of scanning data points to retrieve, per channel.
+
+        Yields:
+            DIReading: The scanning data of one channel.
+        """
+        assert count > 0, "Count must be greater than 0."
+        yield from self.parent.stream_json(f"JSON:SCAN:DATA? {count}")
 
     def get_intelligent_wiring_data_json(
         self, count: int = 1
@@ -318,7 +390,7 @@ class Scan:
         """
         assert count > 0, "Count must be greater than 0."
         if response := self.parent.cmd(f"JSON:SCAN:SCONnection:DATA? {count}"):
-            return coerce(response)
+            return self.parent.parse(coerce, response)
 
     def start_multi_channel_scan(
         self, channel_list: List[str], sampling_rate: int = 1000, measure: bool = False
@@ -0,0 +1,32 @@
+# scpi.py - Helpers for inspecting SCPI command strings.
+
+
+def header(command: str) -> str:
+    """Return the header of a command, without its parameters.
+
+    Example:
+        >>> header('JSON:SCAN:DATA? 10')
+        'JSON:SCAN:DATA?'
+    """
+    return command.strip().split(None, 1)[0] if command.strip() else ""
+
+
+def is_query(command: str) -> bool:
+    """Return True if the device will send a response to the command."""
+    return header(command).endswith("?")
+
+
+_SCAN_START_HEADERS = {"SCAN:START", "JSON:SCAN:START", "SCAN:MULT:START"}
+
+
+def is_scan_start(command: str) -> bool:
+    """Return True for commands that configure and start a scan."""
+    name = header(command).upper()
+    if name.startswith("MEASURE:"):
+        name = name[len("MEASURE:"):]
+    return name in _SCAN_START_HEADERS
+
+
+def is_scan_stop(command: str) -> bool:
+    """Return True for commands that stop scanning."""
+    return header(command).upper() in {"SCAN:STOP", "MEASURE:SCAN:STOP"}
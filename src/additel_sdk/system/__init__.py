@@ -8,6 +8,8 @@ import logging
 if TYPE_CHECKING:
     from src.additel_sdk import Additel
 
+logger = logging.getLogger(__name__)
+
 # Section 1.4 - System Commands
 
 
@@ -155,4 +157,4 @@ class System:
             if err['error_code'] == 0:
                 break
             i += 1
-        logging.debug(f"Flushed {i} errors.")
+        logger.debug("Flushed %d errors.", i)
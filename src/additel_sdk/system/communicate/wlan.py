@@ -5,6 +5,8 @@ if TYPE_CHECKING:
     from src.additel_sdk import Additel
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 class WLAN:
     def __init__(self, parent: "Additel"):
@@ -217,7 +219,7 @@ class WLAN:
         else:
             command = f'SYSTem:COMMunicate:SOCKet:WLAN:CONNect {ssid},"{password}"'
         if response := self.parent.cmd(command):
-            logging.info(response.strip())
+            logger.info("%s", response.strip())
 
     # 1.4.23
     def get_connection(self) -> str:
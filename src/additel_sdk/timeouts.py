@@ -0,0 +1,121 @@
+# timeouts.py - Per-command response timeouts.
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from .scpi import header
+
+
+class TimeoutPolicy:
+    """Choose a response timeout for each command from its header.
+
+    Until enough responses to a header have been observed, the timeout is
+    estimated from the expected size of the response: `latency` plus the
+    expected number of bytes over `throughput`. Bulk queries such as
+    ``JSON:SCAN:DATA? 1000`` scale with their count (or with the number of
+    channels they name), so they get proportionally longer. After `min_samples`
+    responses, the timeout is `margin` times the observed `percentile` of the
+    recent latencies instead, so short queries fail over quickly. The result is
+    always clamped to [`minimum`, `maximum`].
+
+    Queries with a count argument are learned per power-of-two bucket of the
+    count, since ``JSON:SCAN:DATA? 1`` and ``JSON:SCAN:DATA? 1000`` take very
+    different times.
+
+    Args:
+        minimum (float): Shortest timeout, in seconds.
+        maximum (float): Longest timeout, in seconds.
+        latency (float): Expected round trip of an empty response, in seconds.
+        throughput (float): Expected transfer rate, in bytes per second.
+        percentile (float): Percentile of the observed latencies to use, 0-1.
+        margin (float): Multiplier applied to the observed percentile.
+        window (int): Number of recent latencies kept per header.
+        min_samples (int): Observations needed before the learned value is used.
+
+    Example:
+        >>> policy = TimeoutPolicy()
+        >>> policy.set("*OPC?", 0.5)
+        >>> Additel("wlan", ip="192.168.1.10", timeout_policy=policy)
+    """
+
+    # Expected response size by upper-case header: (fixed bytes, bytes per unit),
+    # where a unit is the count argument or one channel named in the argument.
+    sizes: Dict[str, Tuple[int, int]] = {
+        "JSON:SCAN:DATA?": (800, 160),
+        "JSON:SCAN:SCONNECTION:DATA?": (800, 160),
+        "SCAN:DATA:LAST?": (100, 0),
+        "JSON:MODULE:CONFIG?": (1500, 0),
+        "MODULE:CONFIG?": (800, 0),
+        "CHANNEL:CONFIG:JSON?": (0, 600),
+        "CHANNEL:CONFIG?": (0, 100),
+        "JSON:MODULE:INFORMATION?": (2000, 0),
+    }
+
+    def __init__(
+        self,
+        minimum: float = 0.5,
+        maximum: float = 60.0,
+        latency: float = 0.5,
+        throughput: float = 50_000,
+        percentile: float = 0.99,
+        margin: float = 2.0,
+        window: int = 100,
+        min_samples: int = 20,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency = latency
+        self.throughput = throughput
+        self.percentile = percentile
+        self.margin = margin
+        self.window = window
+        self.min_samples = min_samples
+        self.overrides: Dict[str, float] = {}
+        self._samples: Dict[Tuple[str, int], Deque[float]] = {}
+
+    @staticmethod
+    def _key(command: str) -> Tuple[str, Optional[str]]:
+        name = header(command).upper()
+        if name.startswith("MEASURE:"):
+            name = name[len("MEASURE:"):]
+        argument = command.strip()[len(header(command)):].strip() or None
+        return name, argument
+
+    @staticmethod
+    def _units(argument: Optional[str]) -> int:
+        if not argument:
+            return 1
+        argument = argument.strip('"')
+        if argument.isdigit():
+            return max(1, int(argument))
+        return argument.count(",") + 1
+
+    def set(self, command_header: str, seconds: float) -> None:
+        """Use a fixed timeout for every command with this header."""
+        self.overrides[command_header.upper()] = seconds
+
+    def expected_size(self, command: str) -> int:
+        """Estimate the size of the response to `command`, in bytes."""
+        name, argument = self._key(command)
+        fixed, per_unit = self.sizes.get(name, (0, 0))
+        return fixed + per_unit * self._units(argument)
+
+    def timeout(self, command: str) -> float:
+        """Return the timeout to use while waiting for the response to `command`."""
+        name, argument = self._key(command)
+        if name in self.overrides:
+            return self.overrides[name]
+        samples = self._samples.get((name, self._units(argument).bit_length()))
+        if samples and len(samples) >= self.min_samples:
+            ordered = sorted(samples)
+            rank = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+            seconds = self.margin * ordered[rank]
+        else:
+            seconds = self.latency + self.expected_size(command) / self.throughput
+        return min(self.maximum, max(self.minimum, seconds))
+
+    def observe(self, command: str, seconds: float) -> None:
+        """Record how long the response to `command` took, in seconds."""
+        name, argument = self._key(command)
+        key = (name, self._units(argument).bit_length())
+        if key not in self._samples:
+            self._samples[key] = deque(maxlen=self.window)
+        self._samples[key].append(seconds)
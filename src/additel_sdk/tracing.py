@@ -0,0 +1,106 @@
+# tracing.py - Pluggable span hooks around the SDK's stages.
+"""Spans are opened around connecting, sending, receiving, ``coerce`` and the
+construction of dataclasses from responses, with attributes such as the command,
+the payload size and the number of channels.
+
+By default the hooks do nothing. To export the spans with OpenTelemetry (if it
+is installed)::
+
+    from src.additel_sdk import tracing
+    tracing.use_opentelemetry()
+
+Any other backend can be plugged in by subclassing :class:`Tracer` and passing
+an instance to :func:`set_tracer`.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+
+class Span:
+    """A span that records nothing."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+class _NoOpSpanContext:
+    """Reusable context manager, so a disabled hook allocates nothing."""
+
+    span = Span()
+
+    def __enter__(self) -> Span:
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+
+_NOOP = _NoOpSpanContext()
+
+
+class Tracer:
+    """The default tracer; its spans do nothing.
+
+    Subclasses set `enabled` and override :meth:`start_span`.
+    """
+
+    enabled = False
+
+    def start_span(self, name: str, **attributes: Any):
+        """Return a context manager that yields a :class:`Span`."""
+        return _NOOP
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer that creates OpenTelemetry spans.
+
+    Args:
+        tracer_provider: OpenTelemetry TracerProvider. Defaults to the global one.
+
+    Raises:
+        ImportError: If ``opentelemetry-api`` is not installed.
+    """
+
+    enabled = True
+
+    def __init__(self, tracer_provider=None):
+        from opentelemetry import trace
+
+        self._tracer = trace.get_tracer(
+            __name__.rpartition(".")[0], tracer_provider=tracer_provider
+        )
+
+    @contextmanager
+    def start_span(self, name: str, **attributes: Any) -> Iterator[Any]:
+        attributes = {k: v for k, v in attributes.items() if v is not None}
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    """Send the SDK's spans to `tracer`; pass ``Tracer()`` to disable them."""
+    global _tracer
+    _tracer = tracer
+
+
+def use_opentelemetry(tracer_provider=None) -> OpenTelemetryTracer:
+    """Export the SDK's spans through OpenTelemetry."""
+    tracer = OpenTelemetryTracer(tracer_provider)
+    set_tracer(tracer)
+    return tracer
+
+
+def span(name: str, **attributes: Any):
+    """Open a span on the current tracer."""
+    return _tracer.start_span(name, **attributes)
@@ -0,0 +1,97 @@
+"""Tests for the asyncio client, against a local line-protocol server."""
+
+import asyncio
+import json
+import os
+import pytest
+from src.additel_sdk.aio import AsyncAdditel
+from src.additel_sdk.connection.mock.server import DeviceSimulator
+from src.additel_sdk.scan import DIReading
+
+MOCK_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "src", "additel_sdk", "connection", "mock",
+    "mockADT286.json",
+)
+
+with open(MOCK_FILE) as f:
+    RESPONSES = json.load(f)
+
+
+async def _serve(reader, writer):
+    while line := await reader.readline():
+        command = line.decode().strip()
+        if command.split(None, 1)[0].endswith("?"):
+            writer.write(RESPONSES.get(command, "").encode() + b"\n")
+            await writer.drain()
+    writer.close()
+
+
+def run_with_server(test):
+    async def main():
+        server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await test(port)
+    return asyncio.run(main())
+
+
+def test_identify():
+    async def test(port):
+        async with AsyncAdditel("wlan", ip="127.0.0.1", port=port) as device:
+            return await device.identify()
+    assert run_with_server(test) == {
+        "Product Sequence Number": "685022040027",
+        "Software Version Number": "TAU-HOST 1.1.1.0",
+    }
+
+
+def test_concurrent_devices():
+    async def test(port):
+        devices = [AsyncAdditel("wlan", ip="127.0.0.1", port=port) for _ in range(10)]
+        for device in devices:
+            await device.__aenter__()
+        try:
+            return await asyncio.gather(
+                *(device.Scan.get_data_json(2) for device in devices)
+            )
+        finally:
+            for device in devices:
+                await device.__aexit__(None, None, None)
+    results = run_with_server(test)
+    assert len(results) == 10
+    for readings in results:
+        assert isinstance(readings[0], DIReading)
+        assert len(readings[0].Values) == 2
+
+
+def test_shared_handle_and_pipelining():
+    async def test(port):
+        async with AsyncAdditel("wlan", ip="127.0.0.1", port=port) as device:
+            config, version = await asyncio.gather(
+                device.Channel.get_configuration("REF1"),
+                device.System.get_version(),
+            )
+            many = await device.cmd_many(["*OPC?", "*CLS", "SYSTem:KLOCk?"])
+            return config, version, many
+    config, version, many = run_with_server(test)
+    assert config.Name == "REF1"
+    assert version == "1999.0"
+    assert many == ["1", None, "0"]
+
+
+def test_unsupported_connection_type():
+    with pytest.raises(ValueError, match="Unsupported connection type"):
+        AsyncAdditel("bluetooth")
+
+
+def test_slow_json_reply():
+    # Pauses between the chunks of a JSON reply are longer than partial_timeout.
+    async def test(simulator):
+        async with AsyncAdditel("wlan", ip=simulator.host, port=simulator.port,
+                                timeout=5) as device:
+            readings = await device.Scan.get_data_json(200)
+            return readings, await device.cmd("SCAN:STARt?")
+    with DeviceSimulator(chunk_size=4096, chunk_delay=0.1) as simulator:
+        readings, config = asyncio.run(test(simulator))
+    assert len(readings[0].Values) == 200
+    assert config == "1000,REF1"
@@ -99,3 +99,17 @@ def test_cmd(device: "Additel", command, expected):
     diff = DeepDiff(expected, response)
     assert not diff, f"Response does not match expected: {diff}"
     assert response == expected, "Response must match expected"
+
+
+def test_cmd_many(device: "Additel"):
+    """Test that cmd_many returns one response per query, in order."""
+    responses = device.cmd_many(["*OPC?", "*CLS", "SYSTem:KLOCk?"])
+    assert responses == ["1", None, "0"]
+    assert device.command_log[-3:] == ["*OPC?", "*CLS", "SYSTem:KLOCk?"]
+
+
+def test_submit(device: "Additel"):
+    """Commands queued on the dispatcher resolve in order."""
+    futures = [device.submit(command) for command in ["SCAN:STARt?", "*IDN?"]]
+    assert futures[0].result() == device.cmd("SCAN:STARt?")
+    assert futures[1].result() == device.cmd("*IDN?")
@@ -0,0 +1,72 @@
+"""Tests for SCPI compound-command batching."""
+
+import socket
+import pytest
+from src.additel_sdk import Additel
+from src.additel_sdk.batch import CommandBatch
+from src.additel_sdk.errors import AdditelError
+
+
+def test_messages_joined_from_root():
+    batch = CommandBatch()
+    for command in ["SYSTem:KLOCk 1", "*CLS", "UNIT:TEMPerature 1001"]:
+        batch.add(command)
+    assert batch.messages() == ["SYSTem:KLOCk 1;*CLS;:UNIT:TEMPerature 1001"]
+
+
+def test_messages_respect_max_length():
+    batch = CommandBatch(max_length=40)
+    for command in ["SYSTem:BEEPer:ALARm 0", "SYSTem:KLOCk 1", "SYSTem:BEEPer:TOUCh 0"]:
+        batch.add(command)
+    assert batch.messages() == [
+        "SYSTem:BEEPer:ALARm 0;:SYSTem:KLOCk 1",
+        "SYSTem:BEEPer:TOUCh 0",
+    ]
+
+
+@pytest.fixture
+def sent(device: "Additel", monkeypatch):
+    messages = []
+    monkeypatch.setattr(device.connection, "send_many", messages.extend)
+    return messages
+
+
+def test_batch_flushes_once(device: "Additel", sent, monkeypatch):
+    monkeypatch.setattr(
+        device.System, "get_error",
+        lambda: {"error_code": 0, "error_message": '"No error"'},
+    )
+    with device.batch():
+        device.System.set_local_lock(True)
+        device.System.set_warning_tone(False)
+        device.System.set_keypad_tone(False)
+        assert not sent, "Commands should be queued until the batch ends"
+    assert sent == [
+        "SYSTem:KLOCk 1;:SYSTem:BEEPer:ALARm 0;:SYSTem:BEEPer:TOUCh 0"
+    ]
+    assert device.command_log[-1] == "SYSTem:BEEPer:TOUCh 0"
+
+
+def test_batch_raises_device_error(device: "Additel", sent, monkeypatch):
+    monkeypatch.setattr(
+        device.System, "get_error",
+        lambda: {"error_code": -113, "error_message": '"Undefined header"'},
+    )
+    with pytest.raises(AdditelError):
+        with device.batch():
+            device.System.set_local_lock(True)
+    assert sent == ["SYSTem:KLOCk 1"]
+
+
+def test_cmd_many_flushes_batch_first():
+    device = Additel("wlan")
+    device.connection.socket, peer = socket.socketpair()
+    try:
+        peer.sendall(b'1\n0,"No error"\n')
+        with device.batch():
+            device.send_command("SYSTem:KLOCk 1")
+            assert device.cmd_many(["*OPC?"]) == ["1"]
+        assert peer.recv(4096) == b"SYSTem:KLOCk 1\n*OPC?\nSYSTem:ERRor?\n"
+    finally:
+        device.connection.socket.close()
+        peer.close()
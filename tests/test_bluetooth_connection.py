@@ -0,0 +1,48 @@
+"""Tests for the Bluetooth transport's event-loop thread and reassembly."""
+
+import asyncio
+import pytest
+from src.additel_sdk.connection import Connection
+
+
+@pytest.fixture
+def bluetooth():
+    connection = Connection(None, connection_type="bluetooth", device_name="Compact")
+    connection._start_loop()
+    yield connection
+    connection._stop_loop()
+
+
+def test_coroutines_share_one_loop(bluetooth):
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = bluetooth._run(current_loop())
+    second = bluetooth._run(current_loop())
+    assert first is second is bluetooth._loop
+
+
+def test_packets_reassembled_into_response(bluetooth):
+    response = '{"$type":"TAU.Module.Channels.DI.DIScanInfo","NPLC":1000}'.encode()
+    packets = [response[i:i + 20] for i in range(0, len(response), 20)]
+    for packet in packets + [b"\n1000,REF1\n"]:
+        bluetooth._loop.call_soon_threadsafe(
+            bluetooth._notification_handler, None, packet
+        )
+    assert bluetooth.read_response(timeout=1) == response.decode()
+    assert bluetooth.read_response(timeout=1) == "1000,REF1"
+
+
+def test_read_timeout(bluetooth):
+    with pytest.raises(TimeoutError):
+        bluetooth.read_response(timeout=0.05)
+
+
+def test_run_requires_connection():
+    connection = Connection(None, connection_type="bluetooth", device_name="Compact")
+
+    async def noop():
+        pass
+
+    with pytest.raises(ConnectionError):
+        connection._run(noop())
@@ -0,0 +1,35 @@
+"""Tests for decoding Additel JSON into registered types."""
+
+import copy
+import json
+import pytest
+from src.additel_sdk import coerce as coerce_module
+from src.additel_sdk.coerce import coerce
+from src.additel_sdk.connection.mock.synth import scan_data_json
+from src.additel_sdk.scan import DITCReading, DITemperatureReading
+
+
+def test_input_not_modified():
+    document = json.loads(scan_data_json(["REF1", "CH1-01A"], 3))
+    original = copy.deepcopy(document)
+    readings = coerce(document)
+    assert document == original
+    assert [type(r) for r in readings] == [DITemperatureReading, DITCReading]
+    assert readings[1].CJCs == [23.61] * 3
+
+
+def test_decoder_cached_per_type():
+    coerce(scan_data_json(["REF1"], 2))
+    type_str = "TAU.Module.Channels.DI.DITemperatureReading, TAU.Module.Channels"
+    decoder = coerce_module._decoders[type_str]
+    coerce(scan_data_json(["REF1"], 2))
+    assert coerce_module._decoders[type_str] is decoder
+
+
+def test_unknown_type():
+    with pytest.raises(TypeError, match="Type not found in mapping: Not.A.Type"):
+        coerce({"$type": "Not.A.Type, Nowhere"})
+
+
+def test_untyped_dict_returned_as_is():
+    assert coerce({"a": 1}) == {"a": 1}
@@ -0,0 +1,60 @@
+"""Tests for columnar scan data."""
+
+import pytest
+from src.additel_sdk import columnar
+from src.additel_sdk.coerce import coerce
+from src.additel_sdk.columnar import DIReadingBatch
+from src.additel_sdk.connection.mock.synth import scan_data_json
+
+CHANNELS = ["REF1", "CH1-01A"]
+
+
+def test_requires_numpy(monkeypatch):
+    monkeypatch.setattr(columnar, "np", None)
+    with pytest.raises(ImportError):
+        DIReadingBatch([])
+
+
+def test_from_json():
+    np = pytest.importorskip("numpy")
+    response = scan_data_json(CHANNELS, 4)
+    batch = DIReadingBatch.from_json(response)
+    readings = coerce(response)
+    assert batch.names == ("REF1", "CH1-01A")
+    assert batch.offsets.tolist() == [0, 4, 8]
+    assert batch.codes.tolist() == [0, 0, 0, 0, 1, 1, 1, 1]
+    assert batch.units.tolist() == [r.Unit for r in readings]
+    assert batch.values.dtype == np.float64 and batch.ticks.dtype == np.int64
+    ch1 = batch.channel_slice("CH1-01A")
+    assert batch.temp_values[ch1].tolist() == readings[1].TempValues
+    assert batch.ticks[ch1].tolist() == [t.to_ticks() for t in readings[1].DateTimeTicks]
+    assert np.isnan(batch.cjcs[batch.channel_slice("REF1")]).all()
+    assert batch.timestamps("ms")[0] == np.datetime64(readings[0].DateTimeTicks[0], "ms")
+    assert batch.nbytes == 6 * 8 * batch.sample_count
+
+
+def test_round_trip_to_readings():
+    pytest.importorskip("numpy")
+    readings = coerce(scan_data_json(CHANNELS, 3))
+    rebuilt = DIReadingBatch.from_readings(readings).to_readings()
+    assert [type(r) for r in rebuilt] == [type(r) for r in readings]
+    assert [str(r) for r in rebuilt] == [str(r) for r in readings]
+    assert rebuilt[1].CJCs == readings[1].CJCs
+
+
+def test_get_data_batch(device):
+    pytest.importorskip("numpy")
+    batch = device.Scan.get_data_batch(5)
+    assert batch.names == ("REF1",)
+    assert batch.sample_count == 5
+
+
+def test_from_str():
+    np = pytest.importorskip("numpy")
+    response = ('"REF1,1281,1,638786859365600000,109.129097,109.129097,1001,1,22.7221;'
+                'CH1-01A,1243,1,638786859365600000,------,------,1001,1,------,32767,0,1001,1,23.61;"')
+    batch = DIReadingBatch.from_str(response)
+    assert batch.names == ("REF1", "CH1-01A")
+    assert batch.ticks.tolist() == [638786859365600000] * 2
+    assert batch.values[1] == -np.inf and batch.cjcs[1] == 23.61
+    assert "".join(str(r)[1:-1] for r in batch.to_readings()) == response[1:-1]
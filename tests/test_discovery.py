@@ -0,0 +1,46 @@
+"""Tests for subnet discovery of Additel devices."""
+
+import socket
+import threading
+import time
+from src.additel_sdk.discovery import discover, DiscoveredDevice
+
+
+def _idn_server():
+    server = socket.create_server(("127.0.0.1", 0))
+
+    def serve():
+        while True:
+            try:
+                client, _ = server.accept()
+            except OSError:
+                return
+            with client:
+                client.recv(64)
+                client.sendall(b"'685022040027',TAU-HOST 1.1.1.0\n")
+
+    threading.Thread(target=serve, daemon=True).start()
+    return server
+
+
+def test_discover_responder():
+    server = _idn_server()
+    port = server.getsockname()[1]
+    closed = socket.create_server(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    closed.close()  # Nothing listens here, so the probe is refused
+    try:
+        found = discover("127.0.0.1/32", ports={port: "wlan", closed_port: "ethernet"})
+    finally:
+        server.close()
+    assert found == [
+        DiscoveredDevice("127.0.0.1", port, "wlan", "685022040027", "TAU-HOST 1.1.1.0")
+    ]
+
+
+def test_probes_run_concurrently():
+    # 254 hosts in a TEST-NET range never answer; probes must overlap.
+    start = time.monotonic()
+    found = discover("192.0.2.0/24", ports={9: "wlan"}, timeout=0.2)
+    assert found == []
+    assert time.monotonic() - start < 5
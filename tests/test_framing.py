@@ -0,0 +1,83 @@
+"""Tests for splitting the device byte stream into responses."""
+
+import json
+import socket
+import pytest
+from src.additel_sdk.connection.framing import JSONValuesStreamer, ResponseFramer
+from src.additel_sdk.connection import Connection
+
+
+def test_text_frame():
+    framer = ResponseFramer()
+    framer.feed(b"1000,RE")
+    assert framer.pop() is None, "Frame should not be complete without terminator"
+    framer.feed(b"F1\r\n")
+    assert framer.pop() == b"1000,REF1"
+    assert framer.pop() is None
+
+
+def test_json_frame_split_across_chunks():
+    document = json.dumps({
+        "$type": "TAU.Module.Channels.DI.DIScanInfo, TAU.Module.Channels",
+        "ChannelName": "REF1 {\"quoted\\\" brace}",
+        "Values": {"$values": [1.0, 2.0]},
+    }).encode()
+    framer = ResponseFramer()
+    for i in range(len(document)):
+        framer.feed(document[i:i + 1])
+        frame = framer.pop()
+        if i < len(document) - 1:
+            assert frame is None, f"Frame ended early at byte {i}"
+    assert json.loads(frame) == json.loads(document)
+
+
+def test_leftover_bytes_kept_for_next_frame():
+    framer = ResponseFramer()
+    framer.feed(b'{"a":{"b":1}}\n1\n"REF1,1281,0,1001,0;"')
+    assert framer.pop() == b'{"a":{"b":1}}'
+    assert framer.pop() == b"1"
+    assert framer.pop() is None
+    assert framer.pop_partial() == b'"REF1,1281,0,1001,0;"'
+    assert len(framer) == 0
+
+
+def test_partial_json_not_returned():
+    framer = ResponseFramer()
+    framer.feed(b'{"$type":"x","$values":[')
+    assert framer.pop() is None
+    assert framer.pop_partial() is None
+
+
+def test_values_streamed_byte_by_byte():
+    values = [{"Name": "REF1 {\"[", "Values": {"$values": [1.0, 2.0]}}, {"Name": "CH1"}]
+    document = json.dumps({"$type": "List", "$values": values}).encode()
+    streamer = JSONValuesStreamer()
+    elements = []
+    for i in range(len(document)):
+        streamer.feed(document[i:i + 1])
+        elements.extend(streamer)
+    assert [json.loads(e) for e in elements] == values
+    assert streamer.done
+
+
+def test_values_streamer_keeps_leftover():
+    streamer = JSONValuesStreamer()
+    streamer.feed(b'{"$type":"List","$values":[]}\n1000,REF1\n')
+    assert list(streamer) == []
+    assert streamer.done
+    assert streamer.leftover == b"\n1000,REF1\n"
+
+
+@pytest.mark.parametrize("response", [
+    "1000,REF1",
+    json.dumps({"$type": "List", "$values": [{"Value": i} for i in range(5000)]}),
+], ids=["text", "json"])
+def test_wlan_read_response(response):
+    connection = Connection(None, connection_type="wlan")
+    connection.socket, device = socket.socketpair()
+    try:
+        device.sendall(response.encode() + b"\n")
+        assert connection.read_response(chunk_size=1024) == response
+    finally:
+        connection.socket.close()
+        device.close()
@@ -0,0 +1,62 @@
+"""Tests for the bounded command journal."""
+
+import pytest
+from src.additel_sdk import Additel, CommandJournal
+
+
+def test_capacity_is_bounded():
+    journal = CommandJournal(capacity=3)
+    for i in range(10):
+        journal.sent(f"SYSTem:BEEPer:TOUCh {i % 2}")
+    assert len(journal) == 3
+    assert journal.commands() == [
+        "SYSTem:BEEPer:TOUCh 1", "SYSTem:BEEPer:TOUCh 0", "SYSTem:BEEPer:TOUCh 1"
+    ]
+    assert all(record.outcome == "sent" for record in journal)
+
+
+def test_responses_matched_in_order():
+    journal = CommandJournal()
+    first = journal.sent("*IDN?")
+    journal.sent("*CLS")
+    second = journal.sent("SCAN:STARt?")
+    journal.received('"685022040027",TAU-HOST 1.1.1.0')
+    journal.received(None, outcome="timeout")
+    assert first.outcome == "ok"
+    assert first.bytes_sent == len("*IDN?\n")
+    assert first.bytes_received == len('"685022040027",TAU-HOST 1.1.1.0\n')
+    assert first.latency >= 0
+    assert second.outcome == "timeout"
+
+
+def test_unanswered_query_does_not_shift_pairing(device: "Additel"):
+    device.metrics.reset()
+    device.send_command("NOT:A:COMMand?")
+    response = device.cmd("SCAN:STARt?")
+    unanswered, query = device.journal[-2], device.journal[-1]
+    assert unanswered.outcome == "pending"
+    assert (query.command, query.outcome) == ("SCAN:STARt?", "ok")
+    assert query.bytes_received == len(response) + 1
+    assert device._last_header == "SCAN:STARt?"
+    assert "NOT:A:COMMand?" not in device.metrics.snapshot()
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        CommandJournal(capacity=0)
+
+
+def test_device_journal(device: "Additel"):
+    device.cmd("SCAN:STARt?")
+    device.send_command("*CLS")
+    query, command = device.journal[-2], device.journal[-1]
+    assert (query.command, query.outcome) == ("SCAN:STARt?", "ok")
+    assert (command.command, command.outcome) == ("*CLS", "sent")
+    assert device.command_log[-2:] == ["SCAN:STARt?", "*CLS"]
+
+
+def test_journal_capacity_from_handle():
+    with Additel("mock", use_wlan_fallback=False, journal_capacity=2) as device:
+        for _ in range(5):
+            device.cmd("SCAN:STARt?")
+        assert len(device.command_log) == 2
@@ -0,0 +1,37 @@
+"""Tests for the SDK's logging helpers."""
+
+import logging
+import subprocess
+import sys
+from src.additel_sdk import Additel, Truncated, configure_logging
+
+
+def test_import_leaves_logging_config_alone():
+    code = "import logging, src.additel_sdk; print(logging.getLogger().handlers)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_truncated():
+    assert str(Truncated("1000,REF1")) == "1000,REF1"
+    assert str(Truncated("x" * 1000, limit=10)) == "xxxxxxxxxx... (1000 characters)"
+
+
+def test_configure_logging(tmp_path):
+    path = tmp_path / "additel.log"
+    logger = logging.getLogger("src.additel_sdk")
+    listener = configure_logging(filename=str(path), level=logging.INFO)
+    try:
+        with Additel("mock", use_wlan_fallback=False) as device:
+            device.cmd("JSON:SCAN:DATA? 1")
+    finally:
+        listener.stop()
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+    lines = path.read_text().splitlines()
+    assert any("(mock) Command: JSON:SCAN:DATA? 1" in line for line in lines)
+    response = next(line for line in lines if "Response:" in line)
+    assert response.endswith("characters)"), "Large responses should be truncated"
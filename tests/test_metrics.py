@@ -0,0 +1,43 @@
+"""Tests for per-command metrics."""
+
+import pytest
+from src.additel_sdk import Additel
+from src.additel_sdk.metrics import Histogram, Metrics
+
+
+def test_histogram_bounds_relative_error():
+    histogram = Histogram(precision=4)
+    for value in [0.001 * i for i in range(1, 1001)]:
+        histogram.record(value)
+    assert histogram.count == 1000
+    assert histogram.min == pytest.approx(0.001)
+    assert histogram.max == pytest.approx(1.0)
+    assert histogram.percentile(0.5) == pytest.approx(0.5, rel=0.2)
+    assert histogram.percentile(1.0) == pytest.approx(1.0)
+    assert histogram.buckets()[-1][1] == 1000
+
+
+def test_prometheus_format():
+    metrics = Metrics()
+    metrics.observe("*IDN?", latency=0.01, bytes_sent=6, bytes_received=32)
+    metrics.count_error('CHANnel:CONFig? "REF1"', "timeout")
+    text = metrics.to_prometheus()
+    assert '# TYPE additel_command_latency_seconds histogram' in text
+    assert 'additel_command_latency_seconds_count{command="*IDN?"} 1' in text
+    assert 'additel_command_latency_seconds_bucket{command="*IDN?",le="+Inf"} 1' in text
+    assert (
+        'additel_command_errors_total{command="CHANnel:CONFig? \\"REF1\\"",'
+        'outcome="timeout"} 1'
+    ) in text
+
+
+def test_device_metrics(device: "Additel"):
+    device.metrics.reset()
+    device.Scan.get_data_json(2)
+    device.send_command("*CLS")
+    snapshot = device.metrics.snapshot()
+    scan = snapshot["JSON:SCAN:DATA?"]
+    assert scan["latency"]["count"] == 1
+    assert scan["parse"]["count"] == 1
+    assert scan["bytes_received"]["sum"] > 1000
+    assert snapshot["*CLS"]["bytes_sent"]["sum"] == len("*CLS\n")
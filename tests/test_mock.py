@@ -0,0 +1,87 @@
+"""Tests for recording responses in the mock connection."""
+
+import json
+import pytest
+from src.additel_sdk import Additel
+from src.additel_sdk.connection import Connection, WLANConnection
+from src.additel_sdk.connection.mock import MockConnection
+from src.additel_sdk.connection.mock.server import DeviceSimulator
+
+
+@pytest.fixture
+def response_file(tmp_path, monkeypatch):
+    path = tmp_path / "recorded.json"
+    path.write_text(json.dumps({"*IDN?": "Additel,ADT286,1,2"}))
+    monkeypatch.setattr(MockConnection, "response_file", str(path))
+    monkeypatch.setattr(MockConnection, "responses", {})
+    return path
+
+
+def test_save_response_appends_to_journal(response_file):
+    MockConnection.save_response("SCAN:STARt?", "1000,REF1")
+    MockConnection.save_response("SCAN:STARt?", "1000,CH1-01A")
+    journal = response_file.with_suffix(".jsonl")
+    assert len(journal.read_text().splitlines()) == 2
+    assert json.loads(response_file.read_text()) == {"*IDN?": "Additel,ADT286,1,2"}
+    assert MockConnection.load_responses() == {
+        "*IDN?": "Additel,ADT286,1,2",
+        "SCAN:STARt?": "1000,CH1-01A",
+    }
+
+
+def test_torn_journal_line_ignored(response_file):
+    MockConnection.save_response("SCAN:STARt?", "1000,REF1")
+    with open(response_file.with_suffix(".jsonl"), "a") as f:
+        f.write('{"command": "SYST')
+    assert MockConnection.load_responses()["SCAN:STARt?"] == "1000,REF1"
+
+
+def test_compact_on_exit(response_file):
+    with Connection(None, connection_type="mock", use_wlan_fallback=False):
+        MockConnection.save_response("SCAN:STARt?", "1000,REF1")
+    assert not response_file.with_suffix(".jsonl").exists()
+    assert json.loads(response_file.read_text())["SCAN:STARt?"] == "1000,REF1"
+
+
+def test_fallback_before_synthesized_data(response_file, monkeypatch):
+    with DeviceSimulator(responses={"JSON:SCAN:DATA? 7": "recorded"}) as simulator:
+        monkeypatch.setattr(WLANConnection, "default_port", simulator.port)
+        with Connection(None, connection_type="mock", ip=simulator.host,
+                        use_wlan_fallback=True) as mock:
+            mock.send_command("JSON:SCAN:DATA? 7")
+            assert mock.read_response() == "recorded"
+    assert json.loads(response_file.read_text())["JSON:SCAN:DATA? 7"] == "recorded"
+
+
+@pytest.fixture
+def mock_device():
+    with Additel("mock", use_wlan_fallback=False) as device:
+        yield device
+
+
+@pytest.mark.parametrize("count", [3, 500])
+def test_synthesized_scan_data(mock_device, count):
+    readings = mock_device.Scan.get_data_json(count)
+    assert [r.ChannelName for r in readings] == ["REF1"]
+    ticks = readings[0].DateTimeTicks
+    assert len(ticks) == len(readings[0].Values) == count
+    assert ticks == sorted(ticks, reverse=True), "Newest sample should come first"
+
+
+def test_synthesized_data_follows_scan_channels(mock_device):
+    mock_device.send_command('SCAN:MULT:STARt 1000,"REF1,CH1-01A,CH1-02A"')
+    readings = mock_device.Scan.get_latest_data(longformat=False)
+    assert [r.ChannelName for r in readings] == ["REF1", "CH1-01A", "CH1-02A"]
+    assert len(mock_device.Scan.get_data_json(10)) == 3
+
+
+def test_stream_data_json(mock_device):
+    mock_device.send_command('SCAN:MULT:STARt 1000,"REF1,CH1-01A"')
+    streamed = list(mock_device.Scan.stream_data_json(5))
+    assert [r.ChannelName for r in streamed] == ["REF1", "CH1-01A"]
+    assert all(len(r.Values) == 5 for r in streamed)
+
+
+def test_config_for_any_channel_subset(mock_device):
+    configs = mock_device.Channel.get_configuration_json(["CH1-02A", "REF2", "CH1-10B"])
+    assert [c.Name for c in configs] == ["CH1-02A", "REF2", "CH1-10B"]
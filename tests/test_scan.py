@@ -2,8 +2,11 @@
 
 import pytest
 from src.additel_sdk.errors import AdditelError
-from src.additel_sdk.scan import DIScanInfo, DIReading, Scan
+from src.additel_sdk.scan import (
+    DIScanInfo, DIReading, DITCReading, DITemperatureReading, READING_FORMATS, Scan,
+)
 from src.additel_sdk.coerce import coerce
+from src.additel_sdk.TimeTick import TimeTick
 from typing import List, TYPE_CHECKING
 from time import sleep
 from conftest import use_wlan, use_wlan_fallback
@@ -72,6 +75,49 @@ def test_parse_DIReading_from_str_error(input):
         DIReading.from_str(input)
 
 
+def test_parse_DIReading_from_str_unknown_format():
+    with pytest.raises(ValueError, match="Unrecognized DIReading format with 5 fields."):
+        DIReading.from_str('"REF1,1281,1,638786852530400000,109.131327;"')
+
+
+CONSTRUCTED_READINGS = {
+    DITemperatureReading: (
+        "REF1,1281,1,638786852530400000,109.131327,109.131327,1001,1,22.7278",
+        lambda: DITemperatureReading(
+            ChannelName="REF1", Unit=1281,
+            DateTimeTicks=[TimeTick("638786852530400000")],
+            Values=[109.131327], ValuesFiltered=[109.131327], ValueDecimals=6,
+            TempUnit=1001, TempValues=[22.7278], TempDecimals=4,
+        ),
+    ),
+    DITCReading: (
+        "CH1-01A,1243,1,638786859365600000,------,------,1001,1,------,32767,0,1001,1,23.61",
+        lambda: DITCReading(
+            ChannelName="CH1-01A", Unit=1243,
+            DateTimeTicks=[TimeTick("638786859365600000")],
+            Values=[float("-inf")], ValuesFiltered=[float("-inf")], ValueDecimals=6,
+            TempUnit=1001, TempValues=[float("-inf")], TempDecimals=3,
+            CJCRawsUnit=32767, CJCUnit=1001, CJCs=[23.61], CJCDecimals=2,
+        ),
+    ),
+}
+
+
+@pytest.mark.parametrize("reading_type", READING_FORMATS.values())
+def test_from_str_matches_constructor(reading_type):
+    row, construct = CONSTRUCTED_READINGS[reading_type]
+    [reading] = DIReading.from_str(f'"{row};"')
+    assert type(reading) is reading_type
+    assert vars(reading) == vars(construct())
+
+
+def test_parse_DIReading_from_str_decimals():
+    input = '"REF1,1281,1,638786852530400000,109.13,109.13,1001,1,22.72780;"'
+    [reading] = DIReading.from_str(input)
+    assert (reading.ValueDecimals, reading.TempDecimals) == (2, 5)
+    assert str(reading) == input
+
+
 @pytest.mark.parametrize("desired_channels", [
     ["REF1"],
     ["REF1", "CH1-01A"],
@@ -0,0 +1,75 @@
+"""Tests for the serial transport's bulk, terminator-aware reads."""
+
+import pytest
+from time import sleep
+from src.additel_sdk.connection import Connection
+
+
+class FakeSerialPort:
+    """Serial port double that delivers queued bytes in fixed-size bursts."""
+
+    is_open = True
+
+    def __init__(self, data: bytes, burst: int = 7):
+        self.data = bytearray(data)
+        self.burst = burst
+        self._timeout = None
+        self.timeout_changes = 0
+        self.reads = 0
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        self._timeout = value
+        self.timeout_changes += 1
+
+    @property
+    def in_waiting(self):
+        return min(len(self.data), self.burst)
+
+    def read(self, size=1):
+        self.reads += 1
+        chunk = bytes(self.data[:size])
+        del self.data[:size]
+        return chunk
+
+    def read_until(self, expected=b"\n"):
+        if (end := self.data.find(expected)) < 0:
+            sleep(self._timeout)  # Nothing more arrives before the timeout
+            return self.read(len(self.data))
+        return self.read(end + len(expected))
+
+
+@pytest.fixture
+def serial_connection():
+    return Connection(None, connection_type="serial", port="COM1", timeout=0.05)
+
+
+def test_long_response_not_truncated(serial_connection):
+    config = ";".join(f"CH1-{i:02d}A,1,,100,0,0,0,10,0,K,,,0,0," for i in range(60))
+    serial_connection.serial_port = FakeSerialPort(config.encode() + b"\r\n", 512)
+    assert len(config) > 1024
+    assert serial_connection.read_response() == config
+    assert serial_connection.serial_port.reads <= len(config) // 512 + 2
+
+
+def test_leftover_bytes_carried_to_next_response(serial_connection):
+    serial_connection.serial_port = FakeSerialPort(b"1\r\n1000,REF1\r\n")
+    assert serial_connection.read_response() == "1"
+    assert serial_connection.read_response() == "1000,REF1"
+
+
+def test_timeout_is_overall_deadline(serial_connection):
+    serial_connection.serial_port = FakeSerialPort(b"")
+    with pytest.raises(TimeoutError):
+        serial_connection.read_response()
+
+
+def test_port_timeout_set_once(serial_connection):
+    serial_connection.serial_port = FakeSerialPort(b"1\r\n1000,REF1\r\n", 1)
+    assert serial_connection.read_response() == "1"
+    assert serial_connection.read_response() == "1000,REF1"
+    assert serial_connection.serial_port.timeout_changes == 1
@@ -0,0 +1,131 @@
+"""Tests for the local TCP device simulator."""
+
+import threading
+import pytest
+from src.additel_sdk import Additel
+from src.additel_sdk.connection.mock.server import DeviceSimulator
+from src.additel_sdk.scan import DIReading
+
+
+@pytest.fixture
+def simulator():
+    with DeviceSimulator() as simulator:
+        yield simulator
+
+
+def connect(simulator, timeout=5):
+    return Additel("wlan", ip=simulator.host, port=simulator.port, timeout=timeout)
+
+
+def test_recorded_response(simulator):
+    with connect(simulator) as device:
+        assert device.cmd("SCAN:STARt?") == "1000,REF1"
+
+
+@pytest.mark.parametrize("count", [1, 50, 500])
+def test_synthesized_scan_data(simulator, count):
+    with connect(simulator) as device:
+        readings = device.Scan.get_data_json(count)
+    assert [r.ChannelName for r in readings] == ["REF1"]
+    assert len(readings[0].Values) == count
+    ticks = readings[0].DateTimeTicks
+    assert ticks == sorted(ticks, reverse=True), "Newest sample should come first"
+
+
+def test_scan_channels_follow_scan_start(simulator):
+    with connect(simulator) as device:
+        device.send_command('SCAN:MULT:STARt 1000,"REF1,CH1-01A"')
+        readings = DIReading.from_str(device.cmd("SCAN:DATA:Last? 2"))
+        assert [r.ChannelName for r in readings] == ["REF1", "CH1-01A"]
+        assert [r.ChannelName for r in device.Scan.get_data_json(3)] == ["REF1", "CH1-01A"]
+
+
+def test_chunked_reply():
+    with DeviceSimulator(chunk_size=512, chunk_delay=0.001) as simulator:
+        with connect(simulator) as device:
+            assert len(device.Scan.get_data_json(200)[0].Values) == 200
+
+
+@pytest.mark.parametrize("chunk_size", [None, 64])
+def test_stream_data_json(chunk_size):
+    with DeviceSimulator(chunk_size=chunk_size) as simulator:
+        with connect(simulator) as device:
+            device.send_command('SCAN:MULT:STARt 1000,"REF1,CH1-01A"')
+            readings = list(device.Scan.stream_data_json(100))
+            assert [r.ChannelName for r in readings] == ["REF1", "CH1-01A"]
+            assert all(len(r.Values) == 100 for r in readings)
+            assert device.journal[-1].outcome == "ok"
+            assert device.journal[-1].bytes_received > 0
+            assert device.cmd("SCAN:STARt?") == "1000,REF1"
+
+
+def test_abandoned_stream_is_drained(simulator):
+    with connect(simulator) as device:
+        device.send_command('SCAN:MULT:STARt 1000,"REF1,CH1-01A"')
+        stream = device.Scan.stream_data_json(10)
+        assert next(stream).ChannelName == "REF1"
+        stream.close()
+        assert device.cmd("SCAN:STARt?") == "1000,REF1"
+
+
+@pytest.mark.parametrize("chunk_delay", [0, 0.001])
+def test_chunked_text_reply(chunk_delay):
+    with DeviceSimulator(chunk_size=64, chunk_delay=chunk_delay) as simulator:
+        with connect(simulator) as device:
+            device.send_command('SCAN:MULT:STARt 1000,"REF1,CH1-01A,CH1-02A"')
+            for _ in range(10):
+                readings = DIReading.from_str(device.cmd("SCAN:DATA:Last? 2"))
+                assert [r.ChannelName for r in readings] == ["REF1", "CH1-01A", "CH1-02A"]
+                assert device.cmd("SCAN:STARt?") == "1000,REF1"
+
+
+def test_unknown_query_sets_error(simulator):
+    with connect(simulator, timeout=0.2) as device:
+        device.send_command("NOT:A:COMMand?")
+        assert device.cmd("SYSTem:ERRor?") == '-113,"Undefined header"'
+        assert device.cmd("SYSTem:ERRor?") == '0,"No error"'
+
+
+def test_concurrent_clients(simulator):
+    results = []
+
+    def client():
+        with connect(simulator) as device:
+            results.append(len(device.Scan.get_data_json(100)[0].Values))
+
+    threads = [threading.Thread(target=client) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [100] * 20
+
+
+def test_latency_per_header():
+    simulator = DeviceSimulator(latency={"SCAN:STARt?": 0.2, "*": 0.0})
+    assert simulator._latency("SCAN:STARt?") == 0.2
+    assert simulator._latency("JSON:SCAN:DATA? 5") == 0.0
+
+
+def test_shared_handle_does_not_cross_responses():
+    with DeviceSimulator(latency=0.002) as simulator:
+        commands = {c: simulator.responses[c] for c in ["SCAN:STARt?", "SYSTem:DATE?", "*IDN?"]}
+        with connect(simulator) as device:
+            mismatches = []
+
+            def worker(command, expected):
+                for _ in range(20):
+                    if (response := device.cmd(command)) != expected:
+                        mismatches.append((command, response))
+
+            threads = [
+                threading.Thread(target=worker, args=item)
+                for item in commands.items() for _ in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            futures = [device.submit(command) for command in commands]
+            assert [f.result() for f in futures] == list(commands.values())
+    assert mismatches == []
@@ -0,0 +1,150 @@
+"""Tests for the shared TCP socket transport."""
+
+import socket
+import threading
+import pytest
+from src.additel_sdk import Additel
+from src.additel_sdk.connection import Connection
+from src.additel_sdk.errors import AdditelError
+
+
+@pytest.fixture
+def wlan_pair():
+    connection = Connection(None, connection_type="wlan")
+    connection.socket, device = socket.socketpair()
+    yield connection, device
+    connection.socket.close()
+    device.close()
+
+
+def test_multibyte_character_split_across_chunks(wlan_pair):
+    connection, device = wlan_pair
+    payload = "℃,1001\n".encode()
+    device.sendall(payload[:1])  # First byte of the three-byte "℃"
+    device.sendall(payload[1:])
+    assert connection.read_response(chunk_size=1) == "℃,1001"
+
+
+def test_unterminated_reply_split_inside_character(wlan_pair):
+    connection, device = wlan_pair
+    payload = "Ω".encode()
+    device.sendall(payload[:1])
+    threading.Timer(0.05, device.sendall, args=(payload[1:],)).start()
+    assert connection.read_response() == "Ω"
+
+
+def test_connection_closed_returns_none(wlan_pair):
+    connection, device = wlan_pair
+    device.shutdown(socket.SHUT_WR)
+    assert connection.read_response() is None
+
+
+def test_ethernet_requires_ip():
+    with pytest.raises(ValueError, match="IP address is required"):
+        Connection(None, connection_type="ethernet")
+
+
+def test_send_without_connection():
+    connection = Connection(None, connection_type="wlan", ip="127.0.0.1")
+    with pytest.raises(ConnectionError):
+        connection.send_command("*IDN?")
+
+
+def test_cmd_many_pipelines_queries():
+    device = Additel("wlan", ip="127.0.0.1")
+    device.connection.socket, peer = socket.socketpair()
+    try:
+        # Both replies arrive in one segment; the second must survive the first read.
+        peer.sendall(b"'685022040027',TAU-HOST 1.1.1.0\n1000,REF1\n")
+        responses = device.cmd_many(["*IDN?", "SYSTem:KLOCk 0", "SCAN:STARt?"])
+        assert responses == ["'685022040027',TAU-HOST 1.1.1.0", None, "1000,REF1"]
+        assert peer.recv(4096) == b"*IDN?\nSYSTem:KLOCk 0\nSCAN:STARt?\n"
+    finally:
+        device.connection.socket.close()
+        peer.close()
+
+
+def test_stream_timeout_reports_device_error():
+    device = Additel("wlan", ip="127.0.0.1")
+    device.connection.socket, peer = socket.socketpair()
+    device.connection.socket.settimeout(0.2)
+
+    def reply():
+        with peer.makefile("rb") as lines:
+            lines.readline()  # The JSON query; the reply then stalls
+            peer.sendall(b'{"$type":"List","$values":[')
+            lines.readline()  # SYSTem:ERRor?
+            peer.sendall(b'-113,"Undefined header"\n')
+
+    thread = threading.Thread(target=reply, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(RuntimeError) as excinfo:
+            list(device.stream_json("JSON:SCAN:DATA? 1"))
+        assert isinstance(excinfo.value.__cause__, AdditelError)
+        assert device.journal[-2].outcome == "timeout"
+    finally:
+        thread.join(1)
+        device.connection.socket.close()
+        peer.close()
+
+
+def test_socket_options():
+    server = socket.create_server(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+    connection = Connection(
+        None, connection_type="ethernet", ip="127.0.0.1", port=port, rcvbuf=65536
+    )
+    try:
+        with connection:
+            sock = connection.socket
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 65536
+    finally:
+        server.close()
+
+
+def test_recv_buffer_reused(wlan_pair):
+    connection, device = wlan_pair
+    buffer = connection._recv_buffer
+    device.sendall(b"1\n2\n")
+    assert connection.read_response() == "1"
+    assert connection.read_response() == "2"
+    assert connection._recv_buffer is buffer
+
+
+def test_reconnect_restores_scan_and_replays_query():
+    server = socket.create_server(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+    received = []
+
+    def serve():
+        first, _ = server.accept()
+        with first, first.makefile("rb") as lines:
+            received.append(lines.readline())  # Scan start
+            received.append(lines.readline())  # Query, then the link drops
+        second, _ = server.accept()
+        with second, second.makefile("rb") as lines:
+            received.append(lines.readline())
+            received.append(lines.readline())
+            second.sendall(b"1000,REF1\n")
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    connection = Connection(
+        None, connection_type="wlan", ip="127.0.0.1", port=port,
+        reconnect=True, reconnect_base_delay=0.01,
+    )
+    try:
+        with connection:
+            connection.send_command('SCAN:STARt "1000,REF1"')
+            connection.send_command("SCAN:STARt?")
+            assert connection.read_response() == "1000,REF1"
+    finally:
+        server.close()
+    thread.join(1)
+    assert received == [
+        b'SCAN:STARt "1000,REF1"\n', b"SCAN:STARt?\n",
+        b'SCAN:STARt "1000,REF1"\n', b"SCAN:STARt?\n",
+    ]
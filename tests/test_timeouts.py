@@ -0,0 +1,51 @@
+"""Tests for per-command response timeouts."""
+
+import socket
+import pytest
+from src.additel_sdk import Additel, TimeoutPolicy
+from src.additel_sdk.connection.mock.server import DeviceSimulator
+
+
+def test_default_scales_with_expected_size():
+    policy = TimeoutPolicy(minimum=0.1, latency=0.1, throughput=10_000)
+    assert policy.timeout("*OPC?") == pytest.approx(0.1)
+    assert policy.timeout("JSON:SCAN:DATA? 1000") == pytest.approx(0.1 + 160_800 / 10_000)
+    assert policy.timeout('CHANnel:CONFig:JSON? "REF1,REF2"') > policy.timeout(
+        'CHANnel:CONFig:JSON? "REF1"'
+    )
+
+
+def test_clamped_to_bounds():
+    policy = TimeoutPolicy(minimum=0.5, maximum=5.0)
+    assert policy.timeout("*OPC?") >= 0.5
+    assert policy.timeout("JSON:SCAN:DATA? 1000000") == 5.0
+
+
+def test_learns_from_observed_latency():
+    policy = TimeoutPolicy(minimum=0.01, min_samples=5, margin=2.0, percentile=0.99)
+    for seconds in [0.01, 0.02, 0.03, 0.04, 0.05]:
+        policy.observe("*OPC?", seconds)
+    assert policy.timeout("*OPC?") == pytest.approx(0.1)
+    # Counts in a different power-of-two bucket are learned separately.
+    policy.observe("JSON:SCAN:DATA? 1", 0.01)
+    assert policy.timeout("JSON:SCAN:DATA? 1000") > 1
+
+
+def test_override():
+    policy = TimeoutPolicy()
+    policy.set("*OPC?", 0.25)
+    assert policy.timeout("*OPC?") == 0.25
+
+
+def test_socket_timeout_follows_policy():
+    policy = TimeoutPolicy(minimum=0.2, maximum=10)
+    policy.set("SCAN:STARt?", 0.2)
+    with DeviceSimulator(latency={"SCAN:STARt?": 0.5}) as simulator:
+        with Additel("wlan", ip=simulator.host, port=simulator.port,
+                     timeout=5, timeout_policy=policy) as device:
+            device.cmd("JSON:SCAN:DATA? 100")
+            assert device.connection.socket.gettimeout() == pytest.approx(0.836)
+            device.send_command("SCAN:STARt?")
+            with pytest.raises(socket.timeout):
+                device.connection.read_response()
+    assert len(policy._samples[("JSON:SCAN:DATA?", 7)]) == 1
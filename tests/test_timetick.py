@@ -1,6 +1,7 @@
 from datetime import datetime
+import pytest
 from src.additel_sdk.coerce import coerce
-from src.additel_sdk.TimeTick import TimeTick
+from src.additel_sdk.TimeTick import TimeTick, parse_ticks, to_datetime64, to_epoch_ns
 
 
 def test_timetick():
@@ -11,3 +12,46 @@ def test_timetick():
     result = coerce(data)
     assert isinstance(result, TimeTick)
     assert result == datetime(2025, 3, 22, 14, 5, 12, 123456)
+
+
+@pytest.mark.parametrize("text", [
+    "2025-03-22 16:37:20 160",
+    "2025:03:22 16:37:20 160",
+    "2025-03-22 16:37:20 123456",
+    "2025-3-2 1:2:3 5",  # Not zero-padded; parsed by strptime
+])
+def test_fast_parser_matches_strptime(text):
+    fmt = "%Y-%m-%d %H:%M:%S %f" if "-" in text else "%Y:%m:%d %H:%M:%S %f"
+    expected = datetime.strptime(text, fmt)
+    assert TimeTick(text) == expected
+    assert parse_ticks(text) == TimeTick(text).to_ticks()
+
+
+def test_ticks_are_exact():
+    ticks = 638781769683201230  # Not a whole millisecond
+    tick = TimeTick(str(ticks))
+    assert tick.microsecond == 320123
+    assert tick.to_ticks() == ticks // 10 * 10
+    assert TimeTick(ticks) == tick
+    assert str(tick) == str(tick.to_ticks())
+
+
+def test_invalid_time_rejected():
+    with pytest.raises(ValueError):
+        TimeTick("2025-02-30 00:00:00 000")
+
+
+def test_cached_second_needs_separator():
+    TimeTick("2024-01-01 00:00:00 123")  # Caches the prefix
+    with pytest.raises(ValueError):
+        TimeTick("2024-01-01 00:00:00X123")
+
+
+def test_to_datetime64():
+    np = pytest.importorskip("numpy")
+    stamps = ["2025-03-22 16:37:20 160", "638781769683200000"]
+    expected = np.array(["2025-03-22T16:37:20.160", "2025-03-21T18:02:48.320"],
+                        dtype="datetime64[ns]")
+    assert (to_datetime64(stamps) == expected).all()
+    ticks = np.array([parse_ticks(s) for s in stamps], dtype=np.int64)
+    assert (to_epoch_ns(ticks) == expected.view(np.int64)).all()
@@ -0,0 +1,76 @@
+"""Tests for the span hooks."""
+
+from contextlib import contextmanager
+import socket
+import pytest
+from src.additel_sdk import Additel, tracing
+
+
+class RecordingTracer(tracing.Tracer):
+    enabled = True
+
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def start_span(self, name, **attributes):
+        span = RecordingSpan(name, attributes)
+        self.spans.append(span)
+        yield span
+
+
+class RecordingSpan(tracing.Span):
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+@pytest.fixture
+def tracer():
+    tracer = RecordingTracer()
+    tracing.set_tracer(tracer)
+    yield tracer
+    tracing.set_tracer(tracing.Tracer())
+
+
+def test_default_tracer_is_noop():
+    with tracing.span("additel.send", command="*IDN?") as span:
+        span.set_attribute("payload_size", 5)
+    assert not tracing.get_tracer().enabled
+
+
+def test_spans_around_stages(tracer):
+    with Additel("mock", use_wlan_fallback=False) as device:
+        device.Scan.get_data_json(2)
+    names = [span.name for span in tracer.spans]
+    assert names[:4] == ["additel.connect", "additel.send", "additel.receive", "additel.parse"]
+    assert "additel.coerce" in names
+    assert "additel.construct" in names
+    receive = tracer.spans[2]
+    assert receive.attributes["command"] == "JSON:SCAN:DATA? 2"
+    assert receive.attributes["payload_size"] > 1000
+    parse = tracer.spans[3]
+    assert parse.attributes["channel_count"] == 1
+
+
+def test_opentelemetry_adapter():
+    pytest.importorskip("opentelemetry")
+    assert tracing.OpenTelemetryTracer().enabled
+
+
+def test_pipelined_send_instrumented(tracer):
+    device = Additel("wlan")
+    device.connection.socket, peer = socket.socketpair()
+    try:
+        peer.sendall(b"1\n")
+        assert device.cmd_many(["*CLS", "*OPC?"]) == [None, "1"]
+    finally:
+        device.connection.socket.close()
+        peer.close()
+    send = tracer.spans[0]
+    assert send.name == "additel.send"
+    assert send.attributes["command"] == "*CLS\n*OPC?"
+    assert device.metrics.snapshot()["*CLS"]["bytes_sent"]["sum"] == len("*CLS\n")
@@ -0,0 +1,70 @@
+"""Tests for the USB transport's multi-packet bulk reads."""
+
+import array
+import pytest
+import usb.core
+from src.additel_sdk.connection import Connection
+
+
+class FakeEndpoint:
+    bEndpointAddress = 0x81
+    wMaxPacketSize = 64
+
+    def __init__(self):
+        self.written = []
+
+    def write(self, data):
+        self.written.append(bytes(data))
+
+
+class FakeDevice:
+    """USB device double that completes transfers like libusb bulk reads."""
+
+    def __init__(self, messages):
+        self.messages = [bytearray(m) for m in messages]
+
+    def read(self, address, buffer, timeout):
+        if not self.messages:
+            raise usb.core.USBTimeoutError("Operation timed out")
+        message = self.messages[0]
+        count = min(len(buffer), len(message))
+        buffer[:count] = array.array("B", message[:count])
+        del message[:count]
+        if not message and count < len(buffer):
+            self.messages.pop(0)
+        elif not message:
+            self.messages[0] = bytearray()  # Zero-length packet follows
+        return count
+
+
+@pytest.fixture
+def usb_connection():
+    connection = Connection(None, connection_type="usb", vendor_id=1, product_id=2)
+    connection.device = FakeDevice([])
+    connection.endpoint_in = FakeEndpoint()
+    connection.endpoint_out = FakeEndpoint()
+    connection._buffer = array.array("B", bytes(64 * 4))
+    return connection
+
+
+def test_multi_packet_json_response(usb_connection):
+    document = '{"$type":"List","$values":[' + ",".join(["1.5"] * 400) + "]}"
+    usb_connection.device = FakeDevice([document.encode()])
+    assert len(document) > 64 * 4
+    assert usb_connection.read_response() == document
+
+
+def test_unterminated_short_packet_response(usb_connection):
+    usb_connection.device = FakeDevice([b"1000,REF1"])
+    assert usb_connection.read_response() == "1000,REF1"
+
+
+def test_timeout(usb_connection):
+    with pytest.raises(TimeoutError):
+        usb_connection.read_response(timeout=10)
+
+
+def test_framed_writes(usb_connection):
+    usb_connection.send_command("*IDN?")
+    usb_connection.send_many(["*CLS", "SCAN:STARt?"])
+    assert usb_connection.endpoint_out.written == [b"*IDN?\n", b"*CLS\nSCAN:STARt?\n"]